@@ -5,10 +5,13 @@ This module contains the API for the game.
 from .generators import (
     new_text,
     new_box,
+    new_boxes,
     new_circle,
+    new_circles,
     new_image,
     new_sound,
     new_database,
+    pool,
 )
 from .events import (
     when_program_starts,
@@ -29,12 +32,15 @@ from .utils import (
     start_program,
     stop_program,
     animate,
+    next_frame,
     set_backdrop,
     set_backdrop_image,
     timer,
     key_is_pressed,
     set_physics_simulation_steps,
+    set_physics_threads,
 )
+from .spatial import sprites_at, sprites_in_box, sprites_in_radius, raycast
 from . import auto_start as _auto_start  # noqa: F401 — trigger callback wiring
 from .random import random_number, random_color, random_position
 from ..callback.collision_callbacks import WallSide
@@ -7,7 +7,40 @@ from ..objects import (
     Text as _Text,
     Image as _Image,
     Sound as _Sound,
+    Pool as _Pool,
 )
+from ..objects.sprite import batch_creation as _batch_creation
+
+
+def _per_sprite(name, value, count):
+    """Get one value per sprite for an argument of new_boxes() or new_circles().
+    Lists hold one value per sprite. Anything else, including strings and
+    tuples such as RGB colors, is used for every sprite.
+    :param name: The name of the argument, for error messages.
+    :param value: The value given for the argument.
+    :param count: The number of sprites.
+    :return: A list with one value per sprite."""
+    if isinstance(value, (str, tuple)) or not hasattr(value, "__len__"):
+        return [value] * count
+    if len(value) != count:
+        raise ValueError(
+            f"{name} has {len(value)} values, but there are {count} positions."
+        )
+    return list(value)
+
+
+def _new_many(sprite_class, positions, physics, **properties):
+    positions = list(positions)
+    columns = {
+        name: _per_sprite(name, value, len(positions))
+        for name, value in properties.items()
+    }
+    with _batch_creation(physics) as sprites:
+        for i, (x, y) in enumerate(positions):
+            sprite_class(
+                x=x, y=y, **{name: column[i] for name, column in columns.items()}
+            )
+    return sprites
 
 
 def new_text(
@@ -91,6 +124,62 @@ def new_box(
     )
 
 
+def new_boxes(
+    positions,
+    color="black",
+    width=100,
+    height=200,
+    border_color="light blue",
+    border_width=0,
+    border_radius=0,
+    angle=0,
+    transparency=100,
+    size=100,
+    physics: dict = None,
+) -> list:
+    """Make many box objects at once, much faster than calling new_box() in a loop.
+    Every argument after positions is either one value for all boxes, or a list
+    with one value per box.
+
+    Example:
+
+        bricks = play.new_boxes(
+            [(x, 200) for x in range(-300, 301, 50)],
+            color=["red", "orange"] * 6 + ["red"],
+            width=40,
+            height=20,
+            physics={"can_move": False},
+        )
+
+    :param positions: The (x, y) position of each box.
+    :param color: The color of the boxes.
+    :param width: The width of the boxes.
+    :param height: The height of the boxes.
+    :param border_color: The color of the border of the boxes.
+    :param border_width: The width of the border of the boxes.
+    :param border_radius: The radius of the border (rounding).
+    :param angle: The angle of the boxes.
+    :param transparency: The transparency of the boxes.
+    :param size: The size of the boxes.
+    :param physics: Keyword arguments for start_physics(), used for every box.
+    :return: A list of the new box objects.
+    """
+    return _new_many(
+        _Box,
+        positions,
+        physics,
+        color=color,
+        width=width,
+        height=height,
+        border_color=border_color,
+        border_width=border_width,
+        border_radius=border_radius,
+        angle=angle,
+        transparency=transparency,
+        size=size,
+    )
+
+
 def new_circle(
     color: str = "black",
     x: int = 0,
@@ -127,6 +216,54 @@ def new_circle(
     )
 
 
+def new_circles(
+    positions,
+    color="black",
+    radius=100,
+    border_color="light blue",
+    border_width=0,
+    transparency=100,
+    size=100,
+    angle=0,
+    physics: dict = None,
+) -> list:
+    """Make many circle objects at once, much faster than calling new_circle() in a loop.
+    Every argument after positions is either one value for all circles, or a
+    list with one value per circle.
+
+    Example:
+
+        balls = play.new_circles(
+            [(x, 250) for x in range(-200, 201, 20)],
+            radius=8,
+            physics={"bounciness": 0.8},
+        )
+
+    :param positions: The (x, y) position of each circle.
+    :param color: The color of the circles.
+    :param radius: The radius of the circles.
+    :param border_color: The color of the border of the circles.
+    :param border_width: The width of the border of the circles.
+    :param transparency: The transparency of the circles.
+    :param size: The size of the circles.
+    :param angle: The angle of the circles.
+    :param physics: Keyword arguments for start_physics(), used for every circle.
+    :return: A list of the new circle objects.
+    """
+    return _new_many(
+        _Circle,
+        positions,
+        physics,
+        color=color,
+        radius=radius,
+        border_color=border_color,
+        border_width=border_width,
+        transparency=transparency,
+        size=size,
+        angle=angle,
+    )
+
+
 def new_image(
     image: str = "/path/to/image",
     x: int = 0,
@@ -172,3 +309,31 @@ def new_database(
     :param db_filename: The name of the database file.
     """
     return Database(db_filename=db_filename)
+
+
+def pool(factory, size: int = 10) -> _Pool:
+    """
+    Make a pool of reusable sprites, for things that appear and disappear all
+    the time like bullets. Taking a sprite from the pool and giving it back only
+    shows and hides it, which is much faster than making and removing sprites.
+
+    Example:
+
+        bullets = play.pool(lambda: play.new_box(width=4, height=10), size=20)
+
+        @play.when_key_pressed("space")
+        def shoot(key):
+            bullet = bullets.acquire(x=player.x, y=player.y)
+            bullet.physics.y_speed = 400
+
+        @play.repeat_forever
+        def clean_up():
+            for bullet in bullets.in_use:
+                if bullet.y > play.screen.top:
+                    bullets.release(bullet)
+
+    :param factory: A function without arguments that makes one sprite.
+    :param size: The number of sprites to make up front.
+    :return: A new pool.
+    """
+    return _Pool(factory, size)
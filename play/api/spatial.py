@@ -0,0 +1,118 @@
+"""Functions to find sprites at a point, in an area or along a line."""
+
+import pygame
+import pymunk as _pymunk
+
+from ..globals import globals_list
+from ..io.screen import convert_pos as _convert_pos
+from ..physics import (
+    physics_space,
+    shape_sprites,
+    QUERY_FILTER as _QUERY_FILTER,
+    flush_static_reindex as _flush_static_reindex,
+)
+
+
+def _start_physics_near(touches):
+    """Sprites only get physics once they need it. Give it to every shown
+    sprite without physics whose drawn rect passes touches(rect), so the
+    query on the physics space can find it."""
+    for sprite in globals_list.sprites_group:
+        if sprite._physics is None and not sprite.is_hidden and touches(sprite.rect):
+            sprite._start_default_physics()
+
+
+def _screen_area(x1, y1, x2, y2):
+    """Get the pygame Rect on the screen covering a rectangle in play coordinates."""
+    left, top = _convert_pos(min(x1, x2), max(y1, y2))
+    right, bottom = _convert_pos(max(x1, x2), min(y1, y2))
+    return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+
+def _sprites_for_shapes(shapes):
+    """Turn pymunk shapes into their sprites, skipping walls."""
+    return [shape_sprites[shape] for shape in shapes if shape in shape_sprites]
+
+
+def sprites_at(point):
+    """
+    Get all sprites that are touching a point.
+
+    Example:
+
+        @play.when_mouse_clicked
+        def click():
+            for sprite in play.sprites_at((play.mouse.x, play.mouse.y)):
+                sprite.hide()
+
+    :param point: The point as an (x, y) tuple.
+    :return: A list of sprites that contain the point.
+    """
+    screen_point = _convert_pos(*point)
+    _start_physics_near(lambda rect: rect.collidepoint(screen_point))
+    _flush_static_reindex()
+    hits = physics_space.point_query(tuple(point), 0, _QUERY_FILTER)
+    return _sprites_for_shapes(hit.shape for hit in hits if hit.distance <= 0)
+
+
+def sprites_in_box(rect):
+    """
+    Get all sprites whose bounding box overlaps a rectangle.
+
+    Example:
+
+        enemies_nearby = play.sprites_in_box((-100, -100, 100, 100))
+
+    :param rect: Two opposite corners of the rectangle as (x1, y1, x2, y2).
+    :return: A list of sprites inside or overlapping the rectangle.
+    """
+    x1, y1, x2, y2 = rect
+    area = _screen_area(x1, y1, x2, y2)
+    _start_physics_near(area.colliderect)
+    _flush_static_reindex()
+    bb = _pymunk.BB(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+    return _sprites_for_shapes(physics_space.bb_query(bb, _QUERY_FILTER))
+
+
+def sprites_in_radius(x, y, radius):
+    """
+    Get all sprites that are within a distance of a point.
+
+    Example:
+
+        for coin in play.sprites_in_radius(player.x, player.y, 50):
+            coin.hide()
+
+    :param x: The x-coordinate of the center.
+    :param y: The y-coordinate of the center.
+    :param radius: The distance from the center to search.
+    :return: A list of sprites, closest first.
+    """
+    area = _screen_area(x - radius, y - radius, x + radius, y + radius)
+    _start_physics_near(area.colliderect)
+    _flush_static_reindex()
+    hits = physics_space.point_query((x, y), radius, _QUERY_FILTER)
+    hits.sort(key=lambda hit: hit.distance)
+    return _sprites_for_shapes(hit.shape for hit in hits)
+
+
+def raycast(a, b):
+    """
+    Get all sprites that a straight line from a to b passes through.
+
+    Example:
+
+        targets = play.raycast((player.x, player.y), (play.mouse.x, play.mouse.y))
+        if targets:
+            targets[0].color = "red"
+
+    :param a: The start of the line as an (x, y) tuple.
+    :param b: The end of the line as an (x, y) tuple.
+    :return: A list of sprites on the line, closest to a first.
+    """
+    line = _convert_pos(*a), _convert_pos(*b)
+    _start_physics_near(lambda rect: rect.clipline(*line))
+    _flush_static_reindex()
+    hits = physics_space.segment_query(tuple(a), tuple(b), 0, _QUERY_FILTER)
+    hits.sort(key=lambda hit: hit.alpha)
+    return _sprites_for_shapes(hit.shape for hit in hits)
@@ -7,11 +7,14 @@ import os as _os
 import pygame
 
 from ..callback import callback_manager, CallbackType
-from ..core import game_loop as _game_loop
+from ..core import game_loop as _game_loop, wait_for_frame as _wait_for_frame
 from ..globals import globals_list
 from ..io.keypress import keyboard_state
 from ..loop import get_loop as _get_loop
-from ..physics import set_physics_simulation_steps as _set_physics_simulation_steps
+from ..physics import (
+    set_physics_simulation_steps as _set_physics_simulation_steps,
+    set_physics_threads as _set_physics_threads,
+)
 from ..utils import color_name_to_rgb as _color_name_to_rgb
 
 
@@ -63,7 +66,23 @@ async def animate():
     """
     Wait for the next frame to be drawn.
     """
-    await _asyncio.sleep(0)
+    await _wait_for_frame()
+
+
+async def next_frame(frames=1):
+    """Wait for a number of frames to be drawn. Used with the await keyword like this:
+
+        @play.repeat_forever
+        async def blink():
+            sprite.hide()
+            await play.next_frame(10)
+            sprite.show()
+            await play.next_frame(10)
+
+    :param frames: The number of frames to wait.
+    """
+    for _ in range(frames):
+        await _wait_for_frame()
 
 
 def set_backdrop(color):
@@ -116,6 +135,20 @@ def set_physics_simulation_steps(num_steps: int) -> None:
     _set_physics_simulation_steps(num_steps)
 
 
+def set_physics_threads(num_threads: int) -> None:
+    """
+    Set the number of threads the physics engine uses, so games with many
+    moving sprites can use more than one CPU core.
+
+    Example:
+
+        play.set_physics_threads(2)
+
+    :param num_threads: The number of threads, at most 2 are used.
+    """
+    _set_physics_threads(num_threads)
+
+
 # Register start_program on globals_list so auto_start.py can call it without
 # importing this module (which would create a cyclic import via play.core).
 globals_list.start_program_fn = start_program
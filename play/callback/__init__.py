@@ -37,6 +37,22 @@ class CallbackManager:
         """
         self.callbacks = {}
         self.on_first_callback: Callable = lambda: None
+        # discriminators made by combo_key()
+        self._combo_keys = set()
+        # {(callback_type, filter property names): (table, has_combos)}, see
+        # _dispatch_table(). Cleared whenever callbacks are added or removed.
+        self._dispatch_tables = {}
+
+    def combo_key(self, states) -> int:
+        """
+        Get the discriminator for callbacks that run when exactly this
+        combination of states is active, e.g. keys that are pressed together.
+        :param states: The states, e.g. a list of keys.
+        :return: The discriminator.
+        """
+        key = hash(frozenset(states))
+        self._combo_keys.add(key)
+        return key
 
     def add_callback(
         self, callback_type, callback, callback_discriminator=None
@@ -58,6 +74,7 @@ class CallbackManager:
         self.callbacks[callback_type].setdefault(callback_discriminator, []).append(
             callback
         )
+        self._dispatch_tables.clear()
 
         self.on_first_callback()
 
@@ -74,6 +91,7 @@ class CallbackManager:
         # Does NOT wipe other discriminator buckets for this type.
         if callback_discriminator in self.callbacks[callback_type]:
             self.callbacks[callback_type][callback_discriminator] = []
+        self._dispatch_tables.clear()
 
     def get_callbacks(self, callback_type) -> dict:
         """
@@ -167,6 +185,8 @@ class CallbackManager:
         :param property_filter: A dictionary of properties to filter the callbacks. For example, {'controller': 0}.
         :return: None
         """
+        if not activated_states or not self.callbacks.get(callback_type):
+            return
         if required_args is None:
             required_args = []
         if optional_args is None:
@@ -174,44 +194,64 @@ class CallbackManager:
         if property_filter is None:
             property_filter = {}
 
-        def is_valid_callback(cb):
-            if not callable(cb):
-                return False
-            if hasattr(cb, "is_running") and cb.is_running:
-                return False
+        table, has_combos = self._dispatch_table(callback_type, tuple(property_filter))
+        values = tuple(property_filter.values())
 
-            if property_filter:
-                for key, value in property_filter.items():
-                    if value != "any" and getattr(cb, key, None) != value:
-                        return False
-
-            return True
+        fire_args = (values, required_args, optional_args)
+        for state in activated_states:
+            self._fire_bucket(table.get(state), fire_args, state, *args)
+            self._fire_bucket(table.get("any"), fire_args, state, *args)
+        if has_combos:
+            all_states = hash(frozenset(activated_states))
+            self._fire_bucket(table.get(all_states), fire_args, activated_states, *args)
 
-        if not activated_states or not self.get_callbacks(callback_type):
+    @staticmethod
+    def _fire_bucket(buckets, fire_args, *args):
+        """
+        Fire the callbacks of one discriminator whose filter properties match.
+        :param buckets: The callbacks of a discriminator, by filter property values.
+        :param fire_args: The filter values, required args and optional args.
+        :param args: The arguments to pass to the callbacks.
+        """
+        if not buckets:
             return
+        values, required_args, optional_args = fire_args
+        if "any" in values:
+            matching = [
+                callback
+                for bucket_values, callbacks in buckets.items()
+                if all(v in ("any", b) for v, b in zip(values, bucket_values))
+                for callback in callbacks
+            ]
+        else:
+            matching = buckets.get(values, ())
+        for callback in matching:
+            if not getattr(callback, "is_running", False):
+                fire_async_callback(callback, required_args, optional_args, *args)
 
-        subscriptions = self.get_callbacks(callback_type)
-        for state in activated_states:
-            for callback in subscriptions.get(state, []):
-                if is_valid_callback(callback):
-                    fire_async_callback(
-                        callback, required_args, optional_args, state, *args
-                    )
-            for callback in subscriptions.get("any", []):
-                if is_valid_callback(callback):
-                    fire_async_callback(
-                        callback, required_args, optional_args, state, *args
-                    )
-        all_hash = hash(frozenset(activated_states))
-        for callback in subscriptions.get(all_hash, []):
-            if is_valid_callback(callback):
-                fire_async_callback(
-                    callback,
-                    required_args,
-                    optional_args,
-                    activated_states,
-                    *args,
-                )
+    def _dispatch_table(self, callback_type, filter_names):
+        """
+        Group the callbacks of a type by discriminator, then by the values of
+        their filter properties, so dispatching them is a few dict lookups.
+        The table is built once after callbacks are added or removed.
+        :param callback_type: The type of callback.
+        :param filter_names: The names of the filter properties, e.g. ('controller',).
+        :return: The table and whether it has callbacks for combo_key()s.
+        """
+        table_key = (callback_type, filter_names)
+        if table_key not in self._dispatch_tables:
+            table = {}
+            for discriminator, callbacks in self.callbacks[callback_type].items():
+                buckets = {}
+                for callback in callbacks:
+                    if callable(callback):
+                        values = tuple(getattr(callback, n, None) for n in filter_names)
+                        buckets.setdefault(values, []).append(callback)
+                if buckets:
+                    table[discriminator] = buckets
+            has_combos = not self._combo_keys.isdisjoint(table)
+            self._dispatch_tables[table_key] = table, has_combos
+        return self._dispatch_tables[table_key]
 
 
 callback_manager = CallbackManager()
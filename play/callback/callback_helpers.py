@@ -17,24 +17,37 @@ def run_callback(callback, required_args, optional_args, *args, **kwargs):
     fire_async_callback(callback, required_args, optional_args, *args, **kwargs)
 
 
+def _callback_arg_count(callback):
+    """Count the positional parameters of a callback, respecting
+    original_function wrappers.
+
+    The count is stored on the callback the first time, so callbacks that
+    run every frame don't inspect their signature again.
+    """
+    arg_count = getattr(callback, "_play_arg_count", None)
+    if arg_count is not None:
+        return arg_count
+    if not inspect.iscoroutinefunction(callback):
+        raise ValueError("The callback function must be an async function.")
+    actual_cb = getattr(callback, "original_function", callback)
+    arg_count = len(inspect.getfullargspec(actual_cb).args)
+    try:
+        callback._play_arg_count = arg_count
+    except AttributeError:  # e.g. bound methods
+        pass
+    return arg_count
+
+
 def _resolve_callback_args(callback, required_args, optional_args, *args):
     """Resolve the arguments for a callback, respecting original_function wrappers.
 
     Returns the (actual_cb, callback_args) tuple, or raises ValueError if the
     callback signature doesn't match.
     """
-    if not inspect.iscoroutinefunction(callback):
-        raise ValueError("The callback function must be an async function.")
-    actual_cb = callback
-    if hasattr(callback, "original_function"):
-        actual_cb = callback.original_function
-    actual_args = inspect.getfullargspec(actual_cb).args
-    if (
-        len(required_args)
-        <= len(actual_args)
-        <= len(required_args) + len(optional_args)
-    ):
-        return actual_cb, args[: len(actual_args)]
+    arg_count = _callback_arg_count(callback)
+    actual_cb = getattr(callback, "original_function", callback)
+    if len(required_args) <= arg_count <= len(required_args) + len(optional_args):
+        return actual_cb, args[:arg_count]
     if len(required_args) == 0:
         raise ValueError(
             f"The callback function must not take in any arguments.\n"
@@ -64,29 +77,48 @@ async def run_async_callback(callback, required_args, optional_args, *args, **kw
     await callback(*callback_args, **kwargs)
 
 
-def _task_exception_handler(task):
-    """Log and print exceptions from fire-and-forget callback tasks.
+def _report_callback_error(exc):
+    """Print the full traceback to stderr so students see errors immediately,
+    even if logging is not configured."""
+    traceback.print_exception(type(exc), exc, exc.__traceback__)
+    play_logger.critical("Error in callback task: %s", exc)
 
-    Prints the full traceback to stderr so students see errors immediately,
-    even if logging is not configured.
-    """
+
+def _task_exception_handler(task):
+    """Log and print exceptions from fire-and-forget callback tasks."""
     if task.cancelled():
         return
     exc = task.exception()
     if exc is not None:
-        traceback.print_exception(type(exc), exc, exc.__traceback__)
-        play_logger.critical("Error in callback task: %s", exc)
+        _report_callback_error(exc)
+
+
+def _run_now(coroutine):
+    """Run the coroutine of a callback that never awaits to its end, right away."""
+    try:
+        coroutine.send(None)
+    except StopIteration:
+        return
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        _report_callback_error(exc)
+        return
+    coroutine.close()
+    raise RuntimeError("A callback marked with is_sync awaited something.")
 
 
 def fire_async_callback(callback, required_args, optional_args, *args, **kwargs):
     """Like run_async_callback but schedules the callback as a task (fire-and-forget).
 
     Use this for event callbacks (key press, mouse click, etc.) that should not
-    block the game loop when they contain awaits like play.timer().
+    block the game loop when they contain awaits like play.timer(). Callbacks
+    marked with is_sync never await, so they run right away without a task.
     """
     _, callback_args = _resolve_callback_args(
         callback, required_args, optional_args, *args
     )
+    if getattr(callback, "is_sync", False):
+        _run_now(callback(*callback_args, **kwargs))
+        return
     task = _get_loop().create_task(callback(*callback_args, **kwargs))
     task.add_done_callback(_task_exception_handler)
 
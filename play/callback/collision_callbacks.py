@@ -4,7 +4,8 @@ from enum import Enum
 
 from pymunk import Shape, Arbiter
 
-from ..physics import physics_space
+from ..physics import physics_space, shape_sprites
+from .callback_helpers import run_async_callback
 
 
 class WallSide(Enum):
@@ -29,15 +30,153 @@ class CollisionCallbackRegistry:  # pylint: disable=too-few-public-methods
     def __init__(self):
         self.callbacks = {True: {}, False: {}}
         self.shape_registry = {}
+        self.handled_pairs = set()
+        # {begin: {collision_type: {tag: callback}}} for when_touching("tag")
+        self.tag_callbacks = {True: {}, False: {}}
 
+    def _install_handler(self, collision_type_a, collision_type_b):
+        """Install the begin/separate handlers for one pair of collision types.
+
+        Only pairs that have a callback get a handler, so every other contact
+        is resolved inside pymunk without calling into Python.
+        """
+        pair = frozenset((collision_type_a, collision_type_b))
+        if pair in self.handled_pairs:
+            return
+        self.handled_pairs.add(pair)
+        self._on_collision(
+            collision_type_a,
+            collision_type_b,
+            self._handle_collision,
+            self._handle_end_collision,
+        )
+
+    @staticmethod
+    def _on_collision(collision_type_a, collision_type_b, begin, separate):
+        """Set begin/separate handlers on the physics space for a collision pair.
+
+        collision_type_b may be None to match any shape touching collision_type_a.
+        """
         try:
             physics_space.on_collision(
-                begin=self._handle_collision, separate=self._handle_end_collision
+                collision_type_a, collision_type_b, begin=begin, separate=separate
             )
         except AttributeError:
-            handler = physics_space.add_default_collision_handler()
-            handler.begin = self._handle_collision
-            handler.separate = self._handle_end_collision
+            if collision_type_b is None:
+                handler = physics_space.add_wildcard_collision_handler(collision_type_a)
+            else:
+                handler = physics_space.add_collision_handler(
+                    collision_type_a, collision_type_b
+                )
+            handler.begin = begin
+            handler.separate = separate
+
+    def track_wall(self, wall_shape):
+        """Keep the touched-walls set of every sprite up to date for a wall.
+
+        Installs a handler for anything touching the wall, so wall queries
+        like sprite.is_touching_wall() can read the result instead of running
+        a collision check against every wall.
+        """
+        wall_shape.collision_type = id(wall_shape)
+        wall_shape._play_collision_type_set = True
+        self._on_collision(
+            wall_shape.collision_type,
+            None,
+            self._handle_wall_begin,
+            self._handle_wall_separate,
+        )
+
+    def register_tag(self, sprite, shape: Shape, tag, callback, begin: bool = True):
+        """
+        Register a callback for a sprite touching any sprite with a tag.
+
+        One handler for everything touching the sprite covers every tagged
+        sprite, so tagging or untagging sprites needs no registration at all.
+        """
+        shape.collision_id = CollisionType.SPRITE
+        shape.collision_type = id(shape)
+        self.shape_registry[shape.collision_type] = sprite
+
+        callbacks = self.tag_callbacks[begin].setdefault(shape.collision_type, {})
+        if tag in callbacks:
+            event_type = "when_touching" if begin else "when_stopped_touching"
+            raise ValueError(
+                f'You already have a @sprite.{event_type}("{tag}") for this sprite. '
+                f"You can only use one. Put all your code in a single function instead."
+            )
+        callbacks[tag] = callback
+
+        pair = frozenset((shape.collision_type, None))
+        if pair not in self.handled_pairs:
+            self.handled_pairs.add(pair)
+            self._on_collision(
+                shape.collision_type,
+                None,
+                self._handle_tag_begin,
+                self._handle_tag_separate,
+            )
+
+    @staticmethod
+    def _bind_tag_callback(callback, tag, other):
+        """Make a callback for the touching and stopped lists, which take no
+        arguments, that passes the tagged sprite while it still has the tag."""
+
+        async def bound():
+            if tag in other.events.tags:
+                await run_async_callback(callback, [], ["sprite"], other)
+
+        return bound
+
+    def _handle_tag_begin(self, arbiter, _, __):
+        # a handler for one collision type gets that type's shape first
+        shape, other_shape = arbiter.shapes
+        sprite = self.shape_registry.get(shape.collision_type)
+        other = shape_sprites.get(other_shape)
+        callbacks = self.tag_callbacks[True].get(shape.collision_type)
+        if sprite is None or other is None or not callbacks:
+            return True
+        for tag in other.events.tags & callbacks.keys():
+            sprite.events.set_touching(
+                (tag, other), self._bind_tag_callback(callbacks[tag], tag, other)
+            )
+        return True
+
+    def _handle_tag_separate(self, arbiter, _, __):
+        shape, other_shape = arbiter.shapes
+        sprite = self.shape_registry.get(shape.collision_type)
+        other = shape_sprites.get(other_shape)
+        if sprite is None or other is None:
+            return True
+        for tag in self.tag_callbacks[True].get(shape.collision_type, ()):
+            if sprite.events.get_touching((tag, other)):
+                sprite.events.clear_touching((tag, other))
+        stopped = self.tag_callbacks[False].get(shape.collision_type, {})
+        for tag in other.events.tags & stopped.keys():
+            sprite.events.set_stopped(
+                (tag, other), self._bind_tag_callback(stopped[tag], tag, other)
+            )
+        return True
+
+    @staticmethod
+    def _wall_contact(arbiter):
+        """Return the (sprite, wall_shape) pair of a contact with a wall."""
+        shape_a, shape_b = arbiter.shapes
+        if not hasattr(shape_a, "wall_side"):
+            shape_a, shape_b = shape_b, shape_a
+        return shape_sprites.get(shape_b), shape_a
+
+    def _handle_wall_begin(self, arbiter, _, __):
+        sprite, wall_shape = self._wall_contact(arbiter)
+        if sprite is not None:
+            sprite.events.add_touching_wall(wall_shape.wall_side)
+        return True
+
+    def _handle_wall_separate(self, arbiter, _, __):
+        sprite, wall_shape = self._wall_contact(arbiter)
+        if sprite is not None:
+            sprite.events.remove_touching_wall(wall_shape.wall_side)
+        return True
 
     def _handle_collision(self, arbiter, _, __):
         shape_a, shape_b = arbiter.shapes
@@ -184,6 +323,7 @@ class CollisionCallbackRegistry:  # pylint: disable=too-few-public-methods
         self.callbacks[begin][shape.collision_type][
             other_shape.collision_type
         ] = callback
+        self._install_handler(shape.collision_type, other_shape.collision_type)
 
     def register(
         self,
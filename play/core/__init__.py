@@ -1,5 +1,7 @@
 """Core game loop and event handling functions."""
 
+import asyncio as _asyncio
+
 import pygame
 
 from .controller_loop import (
@@ -28,6 +30,33 @@ from ..io.keypress import keyboard_state
 
 _clock = pygame.time.Clock()
 
+# Futures of coroutines waiting in wait_for_frame(), resolved once per frame.
+_frame_waiters = []
+# The task running game_loop()
+_game_loop_task = None  # pylint: disable=invalid-name
+
+
+async def wait_for_frame():
+    """Wait until game_loop has finished drawing the next frame."""
+    if _asyncio.current_task() is _game_loop_task:
+        # Called from a callback that game_loop awaits, like a touching
+        # callback. The frame can't finish until this returns.
+        await _asyncio.sleep(0)
+        return
+    future = _get_loop().create_future()
+    _frame_waiters.append(future)
+    await future
+
+
+def _release_frame_waiters():
+    """Resume everything waiting for a frame. Coroutines that wait again
+    are added to a new list, so they resume on the next frame."""
+    global _frame_waiters
+    waiters, _frame_waiters = _frame_waiters, []
+    for future in waiters:
+        if not future.done():
+            future.set_result(None)
+
 
 def _handle_pygame_events():
     """Handle pygame events in the game loop."""
@@ -57,18 +86,8 @@ def _handle_pygame_events():
     return True
 
 
-@listen_to_failure()
-async def game_loop():
-    """The main game loop."""
-    keyboard_state.clear()
-    mouse_state.clear()
-    controller_state.clear()
-
-    _clock.tick(globals_list.frame_rate)
-
-    if not _handle_pygame_events():
-        return
-
+async def _handle_input():
+    """Run the keyboard, mouse and controller callbacks of this frame."""
     await _handle_keyboard()
 
     if (
@@ -81,11 +100,9 @@ async def game_loop():
     if controller_state.any():
         await _handle_controller()
 
-    #############################
-    # physics simulation
-    #############################
-    await simulate_physics()
 
+async def _draw():
+    """Draw the backdrop and every sprite, then show the frame."""
     if globals_list.backdrop_type == "color":
         globals_list.display.fill(globals_list.backdrop)
     elif globals_list.backdrop_type == "image":
@@ -100,6 +117,30 @@ async def game_loop():
 
     pygame.display.flip()
 
-    # @repeat_forever callbacks
-    _get_loop().create_task(game_loop())
-    await callback_manager.run_callbacks_inline(CallbackType.REPEAT_FOREVER)
+
+@listen_to_failure()
+async def game_loop():
+    """The main game loop. Runs one frame after another until the program stops."""
+    global _game_loop_task
+    _game_loop_task = _asyncio.current_task()
+    while True:
+        keyboard_state.clear()
+        mouse_state.clear()
+        controller_state.clear()
+
+        _clock.tick(globals_list.frame_rate)
+
+        if not _handle_pygame_events():
+            return
+
+        await _handle_input()
+        await simulate_physics()
+        await _draw()
+
+        # @repeat_forever callbacks
+        await callback_manager.run_callbacks_inline(CallbackType.REPEAT_FOREVER)
+
+        # Let timers, callback tasks and frame waiters run before the next
+        # frame starts.
+        _release_frame_waiters()
+        await _asyncio.sleep(0)
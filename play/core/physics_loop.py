@@ -2,7 +2,7 @@
 
 from .sprites_loop import update_sprites
 from ..globals import globals_list
-from ..physics import physics_space
+from ..physics import step_physics
 
 
 async def simulate_physics():
@@ -11,6 +11,6 @@ async def simulate_physics():
     """
     # more steps means more accurate simulation but more processing time
     for _ in range(globals_list.num_sim_steps):
-        physics_space.step(1 / (globals_list.frame_rate * globals_list.num_sim_steps))
+        step_physics(1 / (globals_list.frame_rate * globals_list.num_sim_steps))
         if _ != globals_list.num_sim_steps - 1:
             await update_sprites(False)
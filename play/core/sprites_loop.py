@@ -85,7 +85,8 @@ async def update_sprites(do_events: bool = True):
     :param do_events: If True, run events for sprites. If False, only update positions.
     """
     for sprite in globals_list.sprites_group.sprites():
-        if sprite.physics.can_move:
+        # sprites without physics yet have no body to sync from
+        if sprite._physics is not None and sprite.physics.can_move:
             update_sprite_physics(sprite)
 
         sprite.events.is_clicked = False
@@ -8,7 +8,7 @@ from pygame.joystick import (
 )
 
 from ..callback import callback_manager, CallbackType
-from ..utils.async_helpers import make_async
+from ..utils.async_helpers import make_async, is_sync_callback
 from ..callback.callback_helpers import run_async_callback
 
 pygame.joystick.init()
@@ -42,6 +42,7 @@ def when_button(index: int, released: bool, *buttons: list[int | list[int]] | No
             any_wrapper.is_running = False
 
         any_wrapper.is_running = False
+        any_wrapper.is_sync = is_sync_callback(async_callback)
         any_wrapper.controller = index
 
         async def wrapper(button_cb):
@@ -50,6 +51,7 @@ def when_button(index: int, released: bool, *buttons: list[int | list[int]] | No
             wrapper.is_running = False
 
         wrapper.is_running = False
+        wrapper.is_sync = is_sync_callback(async_callback)
         wrapper.controller = index
 
         for button in buttons:
@@ -64,7 +66,7 @@ def when_button(index: int, released: bool, *buttons: list[int | list[int]] | No
                     )
                 continue
             if isinstance(button, list):
-                button = hash(frozenset(button))
+                button = callback_manager.combo_key(button)
             if released:
                 callback_manager.add_callback(
                     CallbackType.WHEN_CONTROLLER_BUTTON_RELEASED, wrapper, button
@@ -216,6 +218,7 @@ class _Controllers:
                 any_wrapper.is_running = False
 
             any_wrapper.is_running = False
+            any_wrapper.is_sync = is_sync_callback(async_callback)
             any_wrapper.controller = index
 
             async def wrapper(button_cb):
@@ -224,6 +227,7 @@ class _Controllers:
                 wrapper.is_running = False
 
             wrapper.is_running = False
+            wrapper.is_sync = is_sync_callback(async_callback)
             wrapper.controller = index
 
             for button in buttons:
@@ -233,7 +237,7 @@ class _Controllers:
                     )
                     continue
                 if isinstance(button, list):
-                    button = hash(frozenset(button))
+                    button = callback_manager.combo_key(button)
                 callback_manager.add_callback(
                     CallbackType.WHILE_CONTROLLER_BUTTON_PRESSED, wrapper, button
                 )
@@ -267,6 +271,7 @@ class _Controllers:
                 wrapper.is_running = False
 
             wrapper.is_running = False
+            wrapper.is_sync = is_sync_callback(async_callback)
             wrapper.axis = axis
             wrapper.controller = index
 
@@ -294,6 +299,7 @@ class _Controllers:
                 wrapper.is_running = False
 
             wrapper.is_running = False
+            wrapper.is_sync = is_sync_callback(async_callback)
             wrapper.axis = None
             wrapper.controller = index
 
@@ -3,7 +3,7 @@
 import pygame
 
 from ..callback import callback_manager, CallbackType
-from ..utils.async_helpers import make_async
+from ..utils.async_helpers import make_async, is_sync_callback
 from ..callback.callback_helpers import run_async_callback
 
 
@@ -44,6 +44,7 @@ def when_any_key(func, released=False):
 
     wrapper.keys = None
     wrapper.is_running = False
+    wrapper.is_sync = is_sync_callback(async_callback)
     if released:
         callback_manager.add_callback(CallbackType.RELEASED_KEYS, wrapper, "any")
     else:
@@ -71,10 +72,11 @@ def when_key(*keys, released=False):
             wrapper.is_running = False
 
         wrapper.is_running = False
+        wrapper.is_sync = is_sync_callback(async_callback)
 
         for key in keys:
             if isinstance(key, list):
-                key = hash(frozenset(key))
+                key = callback_manager.combo_key(key)
             if released:
                 callback_manager.add_callback(CallbackType.RELEASED_KEYS, wrapper, key)
             else:
@@ -104,10 +106,11 @@ def while_key(*keys):
             wrapper.is_running = False
 
         wrapper.is_running = False
+        wrapper.is_sync = is_sync_callback(async_callback)
 
         for key in keys:
             if isinstance(key, list):
-                key = hash(frozenset(key))
+                key = callback_manager.combo_key(key)
             callback_manager.add_callback(CallbackType.WHILE_KEY_PRESSED, wrapper, key)
         return wrapper
 
@@ -125,6 +128,7 @@ def while_any_key(func):
 
     wrapper.keys = None
     wrapper.is_running = False
+    wrapper.is_sync = is_sync_callback(async_callback)
     callback_manager.add_callback(CallbackType.WHILE_KEY_PRESSED, wrapper, "any")
     return wrapper
 
@@ -3,7 +3,7 @@
 import math as _math
 
 from ..callback import callback_manager, CallbackType
-from ..utils.async_helpers import make_async
+from ..utils.async_helpers import make_async, is_sync_callback
 from ..objects.sprite import point_touching_sprite
 from ..callback.callback_helpers import run_async_callback
 
@@ -39,6 +39,7 @@ class Mouse:
                 [],
             )
 
+        wrapper.is_sync = is_sync_callback(async_callback)
         callback_manager.add_callback(
             CallbackType.WHEN_CLICKED,
             wrapper,
@@ -58,6 +59,7 @@ class Mouse:
                 [],
             )
 
+        wrapper.is_sync = is_sync_callback(async_callback)
         callback_manager.add_callback(
             CallbackType.WHEN_CLICK_RELEASED,
             wrapper,
@@ -80,6 +82,7 @@ class Mouse:
             wrapper.is_running = False
 
         wrapper.is_running = False
+        wrapper.is_sync = is_sync_callback(async_callback)
         callback_manager.add_callback(
             CallbackType.WHILE_MOUSE_PRESSED,
             wrapper,
@@ -4,9 +4,9 @@ import pygame
 import pymunk as _pymunk
 
 from ..callback import run_callback, CallbackType, callback_manager
-from ..callback.collision_callbacks import WallSide
+from ..callback.collision_callbacks import WallSide, collision_registry
 from ..globals import globals_list
-from ..physics import physics_space
+from ..physics import physics_space, layer_category
 from ..utils.async_helpers import make_async
 
 
@@ -166,7 +166,9 @@ def create_wall(a, b, wall_side):
     segment.elasticity = 1.0
     segment.friction = 0.0
     segment.wall_side = wall_side
+    segment.filter = _pymunk.ShapeFilter(categories=layer_category("walls"))
     physics_space.add(segment)
+    collision_registry.track_wall(segment)
     return segment
 
 
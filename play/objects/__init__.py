@@ -11,3 +11,4 @@ from .sprite import Sprite
 from .text import Text
 from .image import Image
 from .sound import Sound
+from .pool import Pool
@@ -1,8 +1,7 @@
 """This module contains the Box class, which represents a box in the game."""
 
-import math as _math
 import pygame
-from .sprite import Sprite
+from .sprite import Sprite, shared_surface as _shared_surface
 from ..io.screen import convert_pos
 from ..utils import color_name_to_rgb as _color_name_to_rgb
 
@@ -41,45 +40,64 @@ class Box(Sprite):
     def update(self):
         """Update the box's position, size, angle, transparency, and border."""
         if self._should_recompute:
-            draw_image = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
+            angle_deg = self._draw_angle()
+            look = (
+                type(self),
+                self._color,
+                self._width,
+                self._height,
+                self._border_color,
+                self._border_width,
+                self._border_radius,
+                self._size,
+                self._transparency,
+                angle_deg,
+            )
+            draw_size, self.image = _shared_surface(
+                look, lambda: self._render(angle_deg)
+            )
+
+            self.rect = pygame.Rect((0, 0), draw_size)
+            pos = convert_pos(self.x, self.y)
+            self.rect.x = pos[0] - self.rect.width // 2
+            self.rect.y = pos[1] - self.rect.height // 2
+            self.rect = self.image.get_rect(center=self.rect.center)
+        super().update()
 
-            if self._border_width > 0:
-                pygame.draw.rect(
-                    draw_image,
-                    _color_name_to_rgb(self._border_color),
-                    (0, 0, self._width, self._height),
-                    self._border_width,
-                    border_radius=self._border_radius,
-                )
+    def _render(self, angle_deg):
+        """Draw the box.
+        :param angle_deg: The angle to rotate the box by, in degrees.
+        :return: The size of the unrotated box and the rotated surface."""
+        draw_image = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
 
+        if self._border_width > 0:
             pygame.draw.rect(
                 draw_image,
-                _color_name_to_rgb(self._color),
-                (
-                    self._border_width,
-                    self._border_width,
-                    self._width - 2 * self._border_width,
-                    self._height - 2 * self._border_width,
-                ),
-                border_radius=max(self._border_radius - self._border_width, 0),
+                _color_name_to_rgb(self._border_color),
+                (0, 0, self._width, self._height),
+                self._border_width,
+                border_radius=self._border_radius,
             )
 
-            if self._size != 100:
-                new_w = max(round(self._width * self._size / 100), 1)
-                new_h = max(round(self._height * self._size / 100), 1)
-                draw_image = pygame.transform.scale(draw_image, (new_w, new_h))
+        pygame.draw.rect(
+            draw_image,
+            _color_name_to_rgb(self._color),
+            (
+                self._border_width,
+                self._border_width,
+                self._width - 2 * self._border_width,
+                self._height - 2 * self._border_width,
+            ),
+            border_radius=max(self._border_radius - self._border_width, 0),
+        )
 
-            draw_image.set_alpha(round(self._transparency * 255 / 100))
+        if self._size != 100:
+            new_w = max(round(self._width * self._size / 100), 1)
+            new_h = max(round(self._height * self._size / 100), 1)
+            draw_image = pygame.transform.scale(draw_image, (new_w, new_h))
 
-            self.rect = draw_image.get_rect()
-            pos = convert_pos(self.x, self.y)
-            self.rect.x = pos[0] - self.rect.width // 2
-            self.rect.y = pos[1] - self.rect.height // 2
-
-            angle_deg = _math.degrees(self.physics._pymunk_body.angle)
-            self.image = pygame.transform.rotate(draw_image, angle_deg)
-            self.rect = self.image.get_rect(center=self.rect.center)
-        super().update()
+        draw_image.set_alpha(round(self._transparency * 255 / 100))
+        return draw_image.get_size(), pygame.transform.rotate(draw_image, angle_deg)
 
     ##### width #####
     @property
@@ -94,8 +112,7 @@ class Box(Sprite):
         :param _width: The new width of the box."""
         self._width = _width
         self._should_recompute = True
-        self.physics._remove()
-        self.physics._make_pymunk()
+        self.physics._resize()
 
     ##### height #####
     @property
@@ -110,8 +127,7 @@ class Box(Sprite):
         :param _height: The new height of the box."""
         self._height = _height
         self._should_recompute = True
-        self.physics._remove()
-        self.physics._make_pymunk()
+        self.physics._resize()
 
     ##### color #####
     @property
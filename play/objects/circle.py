@@ -1,8 +1,7 @@
 """This module defines the Circle class, which represents a circle in the game."""
 
-import math as _math
 import pygame
-from .sprite import Sprite
+from .sprite import Sprite, shared_surface as _shared_surface
 from ..io.screen import convert_pos
 from ..utils import color_name_to_rgb as _color_name_to_rgb
 
@@ -50,43 +49,60 @@ class Circle(Sprite):
     def update(self):
         """Update the circle's position, size, angle, transparency, and border."""
         if self._should_recompute:
-            draw_image = pygame.Surface(
-                (self._radius * 2, self._radius * 2), pygame.SRCALPHA
+            angle_deg = self._draw_angle()
+            look = (
+                type(self),
+                self._color,
+                self._radius,
+                self._border_color,
+                self._border_width,
+                self._size,
+                self._transparency,
+                angle_deg,
+            )
+            draw_size, self._image = _shared_surface(
+                look, lambda: self._render(angle_deg)
             )
 
-            if self._border_width > 0:
-                pygame.draw.circle(
-                    draw_image,
-                    _color_name_to_rgb(self._border_color),
-                    (self._radius, self._radius),
-                    self._radius,
-                )
+            self.rect = pygame.Rect((0, 0), draw_size)
+            pos = convert_pos(self.x, self.y)
+            self.rect.x = pos[0] - self.rect.width // 2
+            self.rect.y = pos[1] - self.rect.height // 2
+            self.rect = self._image.get_rect(center=self.rect.center)
+
+        super().update()
+
+    def _render(self, angle_deg):
+        """Draw the circle.
+        :param angle_deg: The angle to rotate the circle by, in degrees.
+        :return: The size of the unrotated circle and the rotated surface."""
+        draw_image = pygame.Surface(
+            (self._radius * 2, self._radius * 2), pygame.SRCALPHA
+        )
 
+        if self._border_width > 0:
             pygame.draw.circle(
                 draw_image,
-                _color_name_to_rgb(self._color),
+                _color_name_to_rgb(self._border_color),
                 (self._radius, self._radius),
-                max(self._radius - self._border_width, 0),
+                self._radius,
             )
 
-            if self._size != 100:
-                scaled_r = max(round(self._radius * self._size / 100), 1)
-                draw_image = pygame.transform.scale(
-                    draw_image, (scaled_r * 2, scaled_r * 2)
-                )
-
-            draw_image.set_alpha(round(self._transparency * 255 / 100))
-
-            self.rect = draw_image.get_rect()
-            pos = convert_pos(self.x, self.y)
-            self.rect.x = pos[0] - self.rect.width // 2
-            self.rect.y = pos[1] - self.rect.height // 2
+        pygame.draw.circle(
+            draw_image,
+            _color_name_to_rgb(self._color),
+            (self._radius, self._radius),
+            max(self._radius - self._border_width, 0),
+        )
 
-            angle_deg = _math.degrees(self.physics._pymunk_body.angle)
-            self._image = pygame.transform.rotate(draw_image, angle_deg)
-            self.rect = self._image.get_rect(center=self.rect.center)
+        if self._size != 100:
+            scaled_r = max(round(self._radius * self._size / 100), 1)
+            draw_image = pygame.transform.scale(
+                draw_image, (scaled_r * 2, scaled_r * 2)
+            )
 
-        super().update()
+        draw_image.set_alpha(round(self._transparency * 255 / 100))
+        return draw_image.get_size(), pygame.transform.rotate(draw_image, angle_deg)
 
     ##### color #####
     @property
@@ -113,9 +129,7 @@ class Circle(Sprite):
         """Set the radius of the circle.
         :param _radius: The radius of the circle."""
         self._radius = _radius
-        # Account for size scaling when updating physics shape
-        size_factor = (self._size or 100) / 100
-        self.physics._pymunk_shape.unsafe_set_radius(self._radius * size_factor)
+        self.physics._resize()
 
     ##### border_color #####
     @property
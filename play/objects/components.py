@@ -3,7 +3,7 @@
 from ..callback import callback_manager, CallbackType
 from ..callback.collision_callbacks import collision_registry, CollisionType, WallSide
 from ..globals import globals_list
-from ..utils.async_helpers import make_async
+from ..utils.async_helpers import make_async, is_sync_callback
 from ..callback.callback_helpers import run_async_callback
 
 
@@ -15,7 +15,9 @@ class EventComponent:
         self._touching_callback = {}
         self._stopped_callback = {}
         self._dependent_sprites = set()
+        self._touching_walls = set()
         self._is_clicked = False
+        self.tags = set()
 
     @property
     def is_clicked(self):
@@ -45,6 +47,22 @@ class EventComponent:
         :param default: Value to return if key is absent."""
         return self._touching_callback.get(key, default)
 
+    @property
+    def touching_walls(self):
+        """Get the walls the sprite touched during the last physics step.
+        :return: A set of WallSide values."""
+        return self._touching_walls
+
+    def add_touching_wall(self, wall_side):
+        """Record that the sprite started touching a wall.
+        :param wall_side: The WallSide of the wall."""
+        self._touching_walls.add(wall_side)
+
+    def remove_touching_wall(self, wall_side):
+        """Record that the sprite stopped touching a wall.
+        :param wall_side: The WallSide of the wall."""
+        self._touching_walls.discard(wall_side)
+
     def set_stopped(self, key, callback):
         """Record a stopped-touching collision callback.
         :param key: Collision key.
@@ -78,6 +96,7 @@ class EventComponent:
             wrapper.is_running = False
 
         wrapper.is_running = False
+        wrapper.is_sync = is_sync_callback(async_callback)
         callback_manager.add_callback(
             CallbackType.WHEN_CLICKED_SPRITE, wrapper, id(self._sprite)
         )
@@ -98,69 +117,75 @@ class EventComponent:
             wrapper.is_running = False
 
         wrapper.is_running = False
+        wrapper.is_sync = is_sync_callback(async_callback)
         callback_manager.add_callback(
             CallbackType.WHEN_CLICK_RELEASED_SPRITE, wrapper, id(self._sprite)
         )
         return wrapper
 
-    def when_touching(self, *sprites_to_check):
-        """Register a callback for when the sprite is touching another sprite.
-        :param sprites_to_check: Sprites to check for collision."""
-
-        def decorator(func):
-            async_callback = make_async(func)
+    def _register_touching_callbacks(self, func, targets, begin, callback_type):
+        """Shared helper for when_touching and when_stopped_touching.
+        :param func: The callback function.
+        :param targets: Sprites, or tag names of sprites, to check for collision.
+        :param begin: True for begin-contact, False for separate.
+        :param callback_type: The CallbackType to use for callback_manager."""
+        async_callback = make_async(func)
+        shape = self._sprite.physics._pymunk_shape
 
-            for target in sprites_to_check:
+        for target in targets:
+            if isinstance(target, str):
+                collision_registry.register_tag(
+                    self._sprite, shape, target, async_callback, begin=begin
+                )
+            else:
                 collision_registry.register(
                     self._sprite,
                     target,
-                    self._sprite.physics._pymunk_shape,
+                    shape,
                     target.physics._pymunk_shape,
                     async_callback,
                     CollisionType.SPRITE,
+                    begin=begin,
                 )
 
-            async def wrapper():
-                await run_async_callback(async_callback, [], [])
+        async def wrapper():
+            await run_async_callback(async_callback, [], [])
 
-            for target in sprites_to_check:
+        async def tag_wrapper(sprite=None):
+            await run_async_callback(async_callback, [], ["sprite"], sprite)
+
+        for target in targets:
+            if isinstance(target, str):
+                callback_manager.add_callback(
+                    callback_type, (tag_wrapper, target), id(self._sprite)
+                )
+            else:
                 target.events._dependent_sprites.add(self._sprite)
                 callback_manager.add_callback(
-                    CallbackType.WHEN_TOUCHING, (wrapper, target), id(self._sprite)
+                    callback_type, (wrapper, target), id(self._sprite)
                 )
-            return wrapper
+        return wrapper
+
+    def when_touching(self, *sprites_to_check):
+        """Register a callback for when the sprite is touching another sprite.
+        :param sprites_to_check: Sprites, or tags of sprites, to check for collision."""
+
+        def decorator(func):
+            return self._register_touching_callbacks(
+                func, sprites_to_check, True, CallbackType.WHEN_TOUCHING
+            )
 
         return decorator
 
     def when_stopped_touching(self, *sprites_to_check):
         """Register a callback for when the sprite is no longer touching another sprite.
-        :param sprites_to_check: Sprites to check for collision separation."""
+        :param sprites_to_check: Sprites, or tags of sprites, to check for collision separation.
+        """
 
         def decorator(func):
-            async_callback = make_async(func)
-
-            for target in sprites_to_check:
-                collision_registry.register(
-                    self._sprite,
-                    target,
-                    self._sprite.physics._pymunk_shape,
-                    target.physics._pymunk_shape,
-                    async_callback,
-                    CollisionType.SPRITE,
-                    begin=False,
-                )
-
-            async def wrapper():
-                await run_async_callback(async_callback, [], [])
-
-            for target in sprites_to_check:
-                target.events._dependent_sprites.add(self._sprite)
-                callback_manager.add_callback(
-                    CallbackType.WHEN_STOPPED_TOUCHING,
-                    (wrapper, target),
-                    id(self._sprite),
-                )
-            return wrapper
+            return self._register_touching_callbacks(
+                func, sprites_to_check, False, CallbackType.WHEN_STOPPED_TOUCHING
+            )
 
         return decorator
 
@@ -1,6 +1,5 @@
 """This module contains the Image class, which is a subclass of the Sprite class."""
 
-import math as _math
 import os
 import pygame
 
@@ -44,7 +43,7 @@ class Image(Sprite):
                     max(round(self._original_height * self._size / 100), 1),
                 ),
             )
-            angle_deg = _math.degrees(self.physics._pymunk_body.angle)
+            angle_deg = self._draw_angle()
             draw_image = pygame.transform.rotate(draw_image, angle_deg)
             draw_image.set_alpha(round(self._transparency * 255 / 100))
 
@@ -0,0 +1,70 @@
+"""This module contains the Pool class, which reuses sprites instead of making new ones."""
+
+
+class Pool:
+    def __init__(self, factory, size):
+        """
+        Make a pool of hidden sprites that can be handed out and given back.
+        :param factory: A function without arguments that makes one sprite.
+        :param size: The number of sprites to make up front.
+        """
+        self._factory = factory
+        self._sprites = set()
+        self._free = []
+        self._in_use = {}  # used as an ordered set
+        # the speeds each sprite was made with, restored every time it is reused
+        self._start_speeds = {}
+        for _ in range(size):
+            self._free.append(self._make_sprite())
+
+    def _make_sprite(self):
+        sprite = self._factory()
+        self._sprites.add(sprite)
+        physics = sprite._physics
+        if physics is not None:
+            self._start_speeds[sprite] = physics.x_speed, physics.y_speed
+        sprite.hide()
+        return sprite
+
+    def acquire(self, x=None, y=None):
+        """
+        Take a sprite from the pool and show it. A new sprite is made if the
+        pool has run out.
+        :param x: The x-coordinate to put the sprite at, or None to leave it.
+        :param y: The y-coordinate to put the sprite at, or None to leave it.
+        :return: The sprite.
+        """
+        sprite = self._free.pop() if self._free else self._make_sprite()
+        if x is not None:
+            sprite.x = x
+        if y is not None:
+            sprite.y = y
+
+        physics = sprite._physics
+        if physics is not None:
+            physics.x_speed, physics.y_speed = self._start_speeds.get(sprite, (0, 0))
+            physics._pymunk_body.angular_velocity = 0
+
+        sprite.show()
+        self._in_use[sprite] = None
+        return sprite
+
+    def release(self, sprite):
+        """
+        Hide a sprite and give it back to the pool, instead of removing it.
+        Releasing a sprite that is already back in the pool does nothing.
+        :param sprite: A sprite that was taken from this pool with acquire().
+        """
+        if sprite not in self._sprites:
+            raise ValueError("This sprite doesn't belong to this pool.")
+        if sprite not in self._in_use:
+            return
+        del self._in_use[sprite]
+        sprite.hide()
+        self._free.append(sprite)
+
+    @property
+    def in_use(self):
+        """Get the sprites that are taken from the pool right now.
+        :return: A list of sprites."""
+        return list(self._in_use)
@@ -2,6 +2,8 @@
 
 import math as _math
 import warnings as _warnings
+from contextlib import contextmanager as _contextmanager
+from dataclasses import dataclass, field
 
 import pygame
 import pymunk as _pymunk
@@ -10,8 +12,13 @@ from ..api.auto_start import _schedule_auto_start
 from ..callback import callback_manager, CallbackType
 from ..callback.collision_callbacks import collision_registry
 from ..globals import globals_list
-from ..io.screen import screen
-from ..physics import physics_space, Physics as _Physics
+from ..io.screen import screen, convert_pos
+from ..physics import (
+    Physics as _Physics,
+    deferred_space_adds as _deferred_space_adds,
+    flush_static_reindex as _flush_static_reindex,
+    queue_static_reindex as _queue_static_reindex,
+)
 from ..utils import clamp as _clamp, is_called_from_pygame
 from .components import EventComponent
 
@@ -21,10 +28,73 @@ def point_touching_sprite(point, sprite):
     :param point: The point (x, y tuple) to check if it's touching the sprite.
     :param sprite: The sprite to check if it's touching the point.
     :return: Whether the point is touching the sprite."""
+    # A sprite without physics can only be touched inside its drawn rect, so
+    # its body is only created once a point actually gets that close.
+    if sprite._physics is None and not sprite.rect.collidepoint(convert_pos(*point)):
+        return False
+    _flush_static_reindex()
     point_info = sprite.physics._pymunk_shape.point_query(point)
     return point_info.distance <= 0
 
 
+# The physics a sprite gets when it first needs some, see Sprite.physics.
+_DEFAULT_PHYSICS = {"stable": True, "obeys_gravity": False}
+
+
+@dataclass
+class _SpriteBatch:
+    """The sprites made inside one batch_creation() block."""
+
+    sprites: list = field(default_factory=list)
+    surfaces: dict = field(default_factory=dict)
+
+
+# The batch being built by batch_creation(), or None outside of it.
+_batch = None  # pylint: disable=invalid-name
+
+
+@_contextmanager
+def batch_creation(physics_options=None):
+    """
+    Make many sprites at once. Sprites created inside the block share one
+    surface per unique look, and are added to the physics space and to the
+    sprite group together when the block ends.
+    :param physics_options: Keyword arguments for start_physics(), used for every sprite.
+        Without them the sprites get their physics lazily, like any other sprite.
+    :return: The list the new sprites are collected in.
+    """
+    global _batch
+    batch = _batch = _SpriteBatch()
+    try:
+        with _deferred_space_adds():
+            yield batch.sprites
+            if physics_options is not None:
+                for sprite in batch.sprites:
+                    sprite.start_physics(**physics_options)
+    finally:
+        _batch = None
+        globals_list.sprites_group.add(*batch.sprites)
+
+
+def shared_surface(look, render):
+    """
+    Render a sprite surface, reusing the one of an identical sprite in the
+    current batch. Outside of batch_creation() this just calls render().
+    :param look: A tuple of everything that affects how the surface looks.
+    :param render: A function that draws the surface.
+    :return: Whatever render() returned for this look.
+    """
+    if _batch is None:
+        return render()
+    try:
+        return _batch.surfaces[look]
+    except KeyError:
+        result = _batch.surfaces[look] = render()
+        return result
+    except TypeError:  # unhashable look, e.g. a color given as a list
+        return render()
+
+
 _should_ignore_update = frozenset(
     {
         "_should_recompute",
@@ -52,7 +122,7 @@ class Sprite(pygame.sprite.Sprite):  # pylint: disable=too-many-public-methods
 
         if not hasattr(self, "events"):
             self.events = EventComponent(self)
-        self.physics = None
+        self._physics = None
 
         if getattr(self, "_image", None) is None:
             self._image = image
@@ -68,13 +138,17 @@ class Sprite(pygame.sprite.Sprite):  # pylint: disable=too-many-public-methods
         _backup_image = getattr(self, "_image", None)
 
         super().__init__()
-        globals_list.sprites_group.add(self)
+        if _batch is None:
+            globals_list.sprites_group.add(self)
+        else:
+            _batch.sprites.append(self)
 
         self.rect = _backup_rect
         if _backup_image is not None:
             self._image = _backup_image
 
-        self.start_physics(stable=True, obeys_gravity=False)
+        # Physics is created on first use (see the physics property), so purely
+        # decorative sprites never add a body to the physics space.
 
         _schedule_auto_start()
 
@@ -95,6 +169,15 @@ class Sprite(pygame.sprite.Sprite):  # pylint: disable=too-many-public-methods
     def get_touching_walls(self) -> list:
         """Get a list of WallSide values for walls the sprite is currently touching.
         :return: A list of WallSide enum values."""
+        if self.physics._wall_contacts_valid():
+            touching = self.events.touching_walls
+            return [
+                wall.wall_side
+                for wall in globals_list.walls
+                if wall.wall_side in touching
+            ]
+
+        _flush_static_reindex()
         touching = []
         for wall in globals_list.walls:
             try:
@@ -132,11 +215,8 @@ class Sprite(pygame.sprite.Sprite):  # pylint: disable=too-many-public-methods
     def x(self, _x):
         """Set the x-coordinate of the sprite.
         :param _x: The x-coordinate of the sprite."""
-        # Requires self.physics to be initialized; only safe after Sprite.__init__() completes.
         self._x = _x
-        self.physics._pymunk_body.position = self._x, self._y
-        if self.physics._pymunk_body.body_type == _pymunk.Body.STATIC:
-            physics_space.reindex_static()
+        self._move_body()
 
     @property
     def y(self):
@@ -148,11 +228,16 @@ class Sprite(pygame.sprite.Sprite):  # pylint: disable=too-many-public-methods
     def y(self, _y):
         """Set the y-coordinate of the sprite.
         :param _y: The y-coordinate of the sprite."""
-        # Requires self.physics to be initialized; only safe after Sprite.__init__() completes.
         self._y = _y
-        self.physics._pymunk_body.position = self._x, self._y
-        if self.physics._pymunk_body.body_type == _pymunk.Body.STATIC:
-            physics_space.reindex_static()
+        self._move_body()
+
+    def _move_body(self):
+        if self._physics is None:
+            return
+        body = self._physics._pymunk_body
+        body.position = self._x, self._y
+        if body.body_type == _pymunk.Body.STATIC:
+            _queue_static_reindex(body)
 
     @property
     def transparency(self):
@@ -201,9 +286,17 @@ You might want to look in your code where you're setting transparency and make s
     def angle(self, _angle):
         """Set the angle of the sprite.
         :param _angle: The angle of the sprite."""
-        # Requires self.physics to be initialized; only safe after Sprite.__init__() completes.
         self._angle = _angle
-        self.physics._pymunk_body.angle = _math.radians(_angle)
+        if self._physics is not None:
+            self._physics._pymunk_body.angle = _math.radians(_angle)
+
+    def _draw_angle(self):
+        """Get the angle to draw the sprite at.
+        :return: The angle in degrees."""
+        physics = getattr(self, "_physics", None)  # Text draws before Sprite.__init__
+        if physics is None:
+            return self._angle
+        return _math.degrees(physics._pymunk_body.angle)
 
     @property
     def size(self):
@@ -215,25 +308,41 @@ You might want to look in your code where you're setting transparency and make s
     def size(self, percent):
         """Set the size of the sprite.
         :param percent: The size of the sprite as a percentage."""
-        # Requires self.physics to be initialized; only safe after Sprite.__init__() completes.
         self._should_recompute = True
         self._size = percent
-        self.physics._remove()
-        self.physics._make_pymunk()
+        if self._physics is not None:
+            self._physics._resize()
 
     def hide(self):
         """Hide the sprite."""
         if self._is_hidden:
             return
         self._is_hidden = True
-        self.physics.pause()
+        if self._physics is not None:
+            self._physics.pause()
 
     def show(self):
         """Show the sprite."""
         if not self._is_hidden:
             return
         self._is_hidden = False
-        self.physics.unpause()
+        if self._physics is not None:
+            self._physics.unpause()
+
+    @property
+    def physics(self):
+        """Get the physics of the sprite. A sprite gets its default physics the
+        first time it is needed, so sprites that are only drawn never add a body
+        to the physics simulation.
+        :return: The Physics object of the sprite."""
+        if self._physics is None:
+            self._start_default_physics()
+        return self._physics
+
+    def _start_default_physics(self):
+        self.start_physics(**_DEFAULT_PHYSICS)
+        if self._is_hidden:
+            self._physics.pause()
 
     @property
     def is_hidden(self):
@@ -270,6 +379,11 @@ You might want to look in your code where you're setting transparency and make s
         :param sprite_or_point: The sprite or point to check if it's touching.
         :return: Whether the sprite is touching the other sprite or point."""
         if isinstance(sprite_or_point, Sprite):
+            physics, other = self.physics, sprite_or_point.physics
+            if physics and other and physics._touching_valid_with(other):
+                # pymunk already found the contacts during the last step
+                return other._pymunk_shape in physics._touching_shapes()
+            _flush_static_reindex()
             try:
                 contact_set = self.physics._pymunk_shape.shapes_collide(
                     sprite_or_point.physics._pymunk_shape
@@ -278,9 +392,7 @@ You might want to look in your code where you're setting transparency and make s
             except (AssertionError, AttributeError):
                 # Fallback: shapes might not be in a valid state for collision check
                 return False
-        # For point collision, use pymunk's point_query
-        point_info = self.physics._pymunk_shape.point_query(sprite_or_point)
-        return point_info.distance <= 0
+        return point_touching_sprite(sprite_or_point, self)
 
     def distance_to(self, x, y=None):
         """Calculate the distance to a point or sprite.
@@ -376,7 +488,8 @@ You might want to look in your code where you're setting transparency and make s
                     _, target = item
                     if hasattr(target, "events"):
                         target.events._dependent_sprites.discard(self)
-        self.physics._remove()
+        if self._physics is not None:
+            self._physics._remove()
         globals_list.sprites_group.remove(self)
 
     def add(self, *groups):
@@ -496,16 +609,43 @@ You might want to look in your code where you're setting transparency and make s
         """
         return self.events.when_click_released(callback, call_with_sprite)
 
+    @property
+    def tags(self):
+        """Get the tags of the sprite, see add_tag().
+        :return: A set of tag names."""
+        return frozenset(self.events.tags)
+
+    def add_tag(self, *tags):
+        """Give the sprite one or more tags. Other sprites can then react to
+        touching any sprite with a tag, e.g. player.when_touching("coin").
+        :param tags: The tag names."""
+        if self._physics is None:
+            self._start_default_physics()
+        self.events.tags.update(tags)
+
+    def remove_tag(self, *tags):
+        """Take one or more tags away from the sprite.
+        :param tags: The tag names."""
+        self.events.tags.difference_update(tags)
+
+    def has_tag(self, tag):
+        """Check if the sprite has a tag.
+        :param tag: The tag name.
+        :return: Whether the sprite has the tag."""
+        return tag in self.events.tags
+
     def when_touching(self, *sprites):
         """Run a function when the sprite is touching another sprite.
-        :param sprites: The sprites to check if they're touching.
+        :param sprites: The sprites to check if they're touching. A tag name
+        matches every sprite with that tag, and the touched sprite can be
+        passed into the function.
         BEWARE: This function will yield the game loop until the given function returns.
         """
         return self.events.when_touching(*sprites)
 
     def when_stopped_touching(self, *sprites):
         """Run a function when the sprite is no longer touching another sprite.
-        :param sprites: The sprites to check if they're touching.
+        :param sprites: The sprites to check if they're touching, or tag names.
         """
         return self.events.when_stopped_touching(*sprites)
 
@@ -571,6 +711,7 @@ You might want to look in your code where you're setting transparency and make s
             return
         for begin in [True, False]:
             collision_registry.callbacks[begin].pop(collision_type, None)
+            collision_registry.tag_callbacks[begin].pop(collision_type, None)
             for shape_ct in list(collision_registry.callbacks[begin]):
                 collision_registry.callbacks[begin][shape_ct].pop(collision_type, None)
         collision_registry.shape_registry.pop(collision_type, None)
@@ -630,6 +771,9 @@ You might want to look in your code where you're setting transparency and make s
         mass=10,
         friction=0,
         sensor=False,
+        layer=None,
+        collides_with=None,
+        fast_moving=False,
     ):
         """Start the physics simulation for this sprite.
         :param can_move: Whether the object can move.
@@ -641,14 +785,17 @@ You might want to look in your code where you're setting transparency and make s
         :param mass: The mass of the object.
         :param friction: The friction of the object.
         :param sensor: Whether the object is a sensor (detects collisions without blocking).
+        :param layer: The name of the collision layer the object is in, e.g. "bullets".
+        :param collides_with: The layer name(s) the object collides with, e.g. ["enemies", "walls"].
+        :param fast_moving: Whether to stop the object passing through thin objects at high speed.
         """
         saved_callbacks = self._save_and_clear_callbacks()
 
-        if self.physics is not None:
-            self._cleanup_collision_registry(self.physics._pymunk_shape.collision_type)
-            self.physics._remove()
+        if self._physics is not None:
+            self._cleanup_collision_registry(self._physics._pymunk_shape.collision_type)
+            self._physics._remove()
 
-        self.physics = _Physics(
+        self._physics = _Physics(
             self,
             can_move,
             stable,
@@ -659,6 +806,9 @@ You might want to look in your code where you're setting transparency and make s
             mass,
             friction,
             sensor=sensor,
+            layer=layer,
+            collides_with=collides_with,
+            fast_moving=fast_moving,
         )
 
         self._reregister_own_callbacks(saved_callbacks)
@@ -666,4 +816,4 @@ You might want to look in your code where you're setting transparency and make s
 
     def stop_physics(self):
         """Resets the physics to the starting situation"""
-        self.start_physics(stable=True, obeys_gravity=False)
+        self.start_physics(**_DEFAULT_PHYSICS)
@@ -1,6 +1,5 @@
 """This module contains the Text class, which is a text string in the game."""
 
-import math as _math
 import os
 import pygame
 from .sprite import Sprite
@@ -55,10 +54,7 @@ class Text(Sprite):
                 new_w = max(round(draw_image.get_width() * self._size / 100), 1)
                 new_h = max(round(draw_image.get_height() * self._size / 100), 1)
                 draw_image = pygame.transform.scale(draw_image, (new_w, new_h))
-            if hasattr(self, "physics") and self.physics is not None:
-                angle_deg = _math.degrees(self.physics._pymunk_body.angle)
-            else:
-                angle_deg = self._angle
+            angle_deg = self._draw_angle()
             if angle_deg:
                 draw_image = pygame.transform.rotate(draw_image, angle_deg)
             draw_image.set_alpha(round(self._transparency * 255 / 100))
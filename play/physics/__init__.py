@@ -1,11 +1,15 @@
 """This handles the physics of the game."""
 
 import math as _math
+import platform as _platform
+from array import array as _array
+from contextlib import contextmanager as _contextmanager
 from dataclasses import dataclass
 
 import pymunk as _pymunk
 
 from ..globals import globals_list
+from ..io.logging import play_logger as _logger
 from ..utils import clamp as _clamp
 
 
@@ -23,6 +27,9 @@ class Physics:
         mass,
         friction,
         sensor=False,
+        layer=None,
+        collides_with=None,
+        fast_moving=False,
     ):
         """
         Examples of objects with different parameters:
@@ -44,6 +51,11 @@ class Physics:
                 (others don't matter)
             Sensor (detects collisions without blocking):
                 sensor = True
+            Bullet that ignores other bullets:
+                layer = "bullets"
+                collides_with = ["enemies", "walls"]
+            Fast ball that must not pass through thin paddles:
+                fast_moving = True
         """
         self.sprite = sprite
         self._can_move = can_move
@@ -55,7 +67,14 @@ class Physics:
         self._mass = mass
         self._friction = friction
         self._sensor = sensor
+        self._layer = layer
+        self._collides_with = _layer_names(collides_with)
+        self._fast_moving = fast_moving
+        self._sweep_radius = 0
         self._is_paused = False
+        self._added_at_step = _step_count
+        self._touching_step = None
+        self._touching = frozenset()
 
         self._make_pymunk()
 
@@ -71,6 +90,56 @@ class Physics:
             )
         return 0.0, self.sprite.width, self.sprite.height
 
+    def _compute_moment(self, mass, is_circle, radius, width, height):
+        """Return the moment of inertia for the given mass and dimensions."""
+        if self.stable:
+            return float("inf")
+        if is_circle:
+            return _pymunk.moment_for_circle(mass, 0, radius, (0, 0))
+        return _pymunk.moment_for_box(mass, (width, height))
+
+    def _set_sweep_radius(self, is_circle, radius, width, height):
+        # a box is swept as the largest circle that fits inside it
+        self._sweep_radius = radius if is_circle else min(width, height) / 2
+
+    def _update_position_swept(self, body, dt):
+        """Move the body like pymunk does, but stop it just inside the first
+        shape it would pass through, so the step still sees that collision.
+        :param body: The pymunk body of this object.
+        :param dt: The length of the step in seconds."""
+        start = body.position
+        _pymunk.Body.update_position(body, dt)
+        if body.body_type != _pymunk.Body.DYNAMIC:
+            return
+        path = body.position - start
+        length = path.length
+        if length == 0:
+            return
+
+        first = None
+        for hit in physics_space.segment_query(
+            start, body.position, self._sweep_radius, self._pymunk_shape.filter
+        ):
+            # skip shapes the body is already moving away from
+            if hit.shape.body is body or hit.shape.sensor or hit.normal.dot(path) >= 0:
+                continue
+            if first is None or hit.alpha < first.alpha:
+                first = hit
+        if first is not None:
+            alpha = min(1, first.alpha + physics_space.collision_slop / length)
+            body.position = start + path * alpha
+
+    def _compute_shape_filter(self):
+        """Build the pymunk ShapeFilter for the layer and collides_with settings."""
+        categories = ALL_LAYERS if self._layer is None else layer_category(self._layer)
+        if self._collides_with is None:
+            mask = _pymunk.ShapeFilter.ALL_MASKS()
+        else:
+            mask = QUERY_CATEGORY
+            for name in self._collides_with:
+                mask |= layer_category(name)
+        return _pymunk.ShapeFilter(categories=categories, mask=mask)
+
     def _compute_body_type(self):
         """Determine the pymunk body type based on movement and stability properties."""
         if not self.can_move:
@@ -95,12 +164,9 @@ class Physics:
             is_circle, size_factor
         )
 
-        if self.stable:
-            moment = float("inf")
-        elif is_circle:
-            moment = _pymunk.moment_for_circle(mass, 0, effective_radius, (0, 0))
-        else:
-            moment = _pymunk.moment_for_box(mass, (effective_w, effective_h))
+        moment = self._compute_moment(
+            mass, is_circle, effective_radius, effective_w, effective_h
+        )
 
         body_type = self._compute_body_type()
 
@@ -114,6 +180,10 @@ class Physics:
         if not self.obeys_gravity:
             self._pymunk_body.velocity_func = lambda body, gravity, damping, dt: None
 
+        if self._fast_moving:
+            self._pymunk_body.position_func = self._update_position_swept
+
+        self._set_sweep_radius(is_circle, effective_radius, effective_w, effective_h)
         if is_circle:
             self._pymunk_shape = _pymunk.Circle(
                 self._pymunk_body, effective_radius, (0, 0)
@@ -126,6 +196,7 @@ class Physics:
         self._pymunk_shape.elasticity = _clamp(self.bounciness, 0, 0.9999)
         self._pymunk_shape.friction = self._friction
         self._pymunk_shape.sensor = self._sensor
+        self._pymunk_shape.filter = self._compute_shape_filter()
 
         # Restore collision attributes so collision callbacks keep working
         if collision_type is not None:
@@ -133,7 +204,42 @@ class Physics:
             self._pymunk_shape.collision_id = collision_id
 
         if not self._is_paused:
-            physics_space.add(self._pymunk_body, self._pymunk_shape)
+            self._add_to_space()
+
+    def _resize(self):
+        """Update the shape's geometry in place after the sprite changed size.
+
+        Unlike _make_pymunk(), this keeps the existing body and shape, so the
+        collision type and every registered collision callback stay valid.
+        """
+        size_factor = (self.sprite._size or 100) / 100
+        is_circle = isinstance(self._pymunk_shape, _pymunk.Circle)
+        effective_radius, effective_w, effective_h = self._compute_effective_dims(
+            is_circle, size_factor
+        )
+
+        self._set_sweep_radius(is_circle, effective_radius, effective_w, effective_h)
+        if is_circle:
+            self._pymunk_shape.unsafe_set_radius(effective_radius)
+        else:
+            half_w, half_h = effective_w / 2, effective_h / 2
+            self._pymunk_shape.unsafe_set_vertices(
+                [
+                    (half_w, -half_h),
+                    (half_w, half_h),
+                    (-half_w, half_h),
+                    (-half_w, -half_h),
+                ]
+            )
+
+        body = self._pymunk_body
+        if body.body_type == _pymunk.Body.DYNAMIC:
+            body.moment = self._compute_moment(
+                self.mass, is_circle, effective_radius, effective_w, effective_h
+            )
+        elif body.body_type == _pymunk.Body.STATIC:
+            queue_static_reindex(body)
+        _changed_bodies.add(body)
 
     def clone(self, sprite):
         """
@@ -151,6 +257,9 @@ class Physics:
             friction=self._friction,
             stable=self.stable,
             sensor=self.sensor,
+            layer=self.layer,
+            collides_with=self.collides_with,
+            fast_moving=self.fast_moving,
         )
 
     def pause(self):
@@ -165,13 +274,77 @@ class Physics:
         if not self._is_paused:
             return
         self._is_paused = False
-        physics_space.add(self._pymunk_body, self._pymunk_shape)
+        self._add_to_space()
+
+    def _add_to_space(self):
+        if _deferred_adds is None:
+            physics_space.add(self._pymunk_body, self._pymunk_shape)
+        else:
+            _deferred_adds.extend((self._pymunk_body, self._pymunk_shape))
+        shape_sprites[self._pymunk_shape] = self.sprite
+        # Contacts such as touched walls only show up after the next step.
+        self._added_at_step = _step_count
+
+    def _contacts_current(self):
+        """Check whether the last step's contacts still describe this object.
+        :return: True if the object was stepped and has not changed since."""
+        return (
+            not self._is_paused
+            and self._added_at_step < _step_count
+            and self._pymunk_body not in _changed_bodies
+        )
+
+    def _wall_contacts_valid(self):
+        """Check whether the sprite's tracked wall contacts are up to date.
+        :return: True if the wall contacts from the last step can be trusted."""
+        return (
+            self._contacts_current()
+            # only dynamic bodies get contacts with the static walls
+            and self._pymunk_body.body_type == _pymunk.Body.DYNAMIC
+            and (self._collides_with is None or "walls" in self._collides_with)
+        )
+
+    def _touching_valid_with(self, other):
+        """Check whether the last step's contacts tell if this object touches other.
+        :param other: The Physics object of the other sprite.
+        :return: True if _touching_shapes() can answer for the pair."""
+        if not (self._contacts_current() and other._contacts_current()):
+            return False
+        # sensors never keep arbiters, and pairs without a dynamic body or
+        # filtered out by their layers never get one
+        if self._pymunk_shape.sensor or other._pymunk_shape.sensor:
+            return False
+        if _pymunk.Body.DYNAMIC not in (
+            self._pymunk_body.body_type,
+            other._pymunk_body.body_type,
+        ):
+            return False
+        own, theirs = self._pymunk_shape.filter, other._pymunk_shape.filter
+        return bool(own.categories & theirs.mask and theirs.categories & own.mask)
+
+    def _touching_shapes(self):
+        """Get the shapes this object was in contact with after the last step.
+        The set is built from the body's arbiters once per step.
+        :return: A set of pymunk shapes."""
+        if self._touching_step != _step_count:
+            shape = self._pymunk_shape
+            touching = set()
+
+            def collect(arbiter):
+                shape_a, shape_b = arbiter.shapes
+                touching.add(shape_b if shape_a is shape else shape_a)
+
+            self._pymunk_body.each_arbiter(collect)
+            self._touching = touching
+            self._touching_step = _step_count
+        return self._touching
 
     def _remove(self):
         if self._is_paused:
             return  # Already removed from space
         physics_space.remove(self._pymunk_body)
         physics_space.remove(self._pymunk_shape)
+        shape_sprites.pop(self._pymunk_shape, None)
 
     @property
     def can_move(self):
@@ -257,6 +430,57 @@ class Physics:
     def sensor(self, value):
         self._sensor = value
         self._pymunk_shape.sensor = value
+        _changed_bodies.add(self._pymunk_body)
+
+    @property
+    def layer(self):
+        """Get the collision layer of the object.
+        :return: The name of the layer, or None if the object is in every layer."""
+        return self._layer
+
+    @layer.setter
+    def layer(self, _layer):
+        """Set the collision layer of the object.
+        :param _layer: The name of the layer, or None to put the object in every layer.
+        """
+        self._layer = _layer
+        self._pymunk_shape.filter = self._compute_shape_filter()
+        _changed_bodies.add(self._pymunk_body)
+
+    @property
+    def collides_with(self):
+        """Get the layers this object collides with.
+        :return: A list of layer names, or None if the object collides with everything.
+        """
+        if self._collides_with is None:
+            return None
+        return list(self._collides_with)
+
+    @collides_with.setter
+    def collides_with(self, layers):
+        """Set the layers this object collides with.
+        :param layers: A layer name, a list of layer names, or None to collide with everything.
+        """
+        self._collides_with = _layer_names(layers)
+        self._pymunk_shape.filter = self._compute_shape_filter()
+        _changed_bodies.add(self._pymunk_body)
+
+    @property
+    def fast_moving(self):
+        """Check if the object is kept from passing through thin objects at high speed.
+        :return: True if the object is fast moving, False otherwise."""
+        return self._fast_moving
+
+    @fast_moving.setter
+    def fast_moving(self, _fast_moving):
+        """Set whether the object is kept from passing through thin objects at high speed.
+        :param _fast_moving: Whether the object is fast moving."""
+        self._fast_moving = _fast_moving
+        self._pymunk_body.position_func = (
+            self._update_position_swept
+            if _fast_moving
+            else _pymunk.Body.update_position
+        )
 
     @property
     def obeys_gravity(self):
@@ -273,6 +497,42 @@ class Physics:
             self._pymunk_body.velocity_func = lambda body, gravity, damping, dt: None
 
 
+# Category bit that only spatial queries use. Every shape's mask contains it and
+# no shape's categories do, so queries find a sprite even if it collides with
+# nothing, while the bit never makes two shapes collide.
+QUERY_CATEGORY = 1 << 31
+ALL_LAYERS = _pymunk.ShapeFilter.ALL_CATEGORIES() & ~QUERY_CATEGORY
+QUERY_FILTER = _pymunk.ShapeFilter(categories=QUERY_CATEGORY)
+
+# Layer names mapped to their ShapeFilter category bit, handed out on first use.
+_layers = {"walls": 1}
+
+
+def layer_category(name):
+    """
+    Get the ShapeFilter category bit of a collision layer, creating it if needed.
+    :param name: The name of the layer, e.g. "bullets".
+    :return: The category bit for the layer.
+    """
+    if name not in _layers:
+        if len(_layers) >= QUERY_CATEGORY.bit_length() - 1:
+            raise ValueError(
+                f"You can't make the collision layer '{name}', because there can be "
+                f"at most {len(_layers)} layers. Try reusing a layer you already have."
+            )
+        _layers[name] = 1 << len(_layers)
+    return _layers[name]
+
+
+def _layer_names(layers):
+    """Normalise a layer name or list of layer names to a tuple (or None)."""
+    if layers is None:
+        return None
+    if isinstance(layers, str):
+        return (layers,)
+    return tuple(layers)
+
+
 @dataclass
 class _Gravity:
     """The gravity of the game."""
@@ -282,12 +542,88 @@ class _Gravity:
 
 
 globals_list.gravity = _Gravity()
-physics_space = _pymunk.Space()
+# pymunk's threaded solver is not available on Windows. A threaded space still
+# steps on a single thread until set_physics_threads() asks for more, so it
+# stays deterministic by default.
+_THREADED_SOLVER = _platform.system() != "Windows"
+physics_space = _pymunk.Space(threaded=_THREADED_SOLVER)
 physics_space.sleep_time_threshold = float("inf")
 physics_space.idle_speed_threshold = 0
 physics_space.gravity = globals_list.gravity.horizontal, globals_list.gravity.vertical
 
 
+# Number of physics steps taken so far by step_physics().
+_step_count = 0  # pylint: disable=invalid-name
+
+# Maps every sprite shape in physics_space back to its sprite, so spatial
+# queries on the space can return sprites. Walls are not in here.
+shape_sprites = {}
+
+# Static bodies whose shapes moved since the last flush. Reindexing them all in
+# one go before the next step avoids a full reindex_static() per position change.
+_pending_static_bodies = set()
+
+# Bodies that moved (static only) or changed shape, sensor or layers since the
+# last step. The contacts pymunk found for them during that step are stale.
+_changed_bodies = set()
+
+
+# Bodies and shapes of new physics objects waiting to be added to physics_space
+# in one call, see deferred_space_adds(). None outside of that block.
+_deferred_adds = None  # pylint: disable=invalid-name
+
+
+@_contextmanager
+def deferred_space_adds():
+    """
+    Collect the bodies and shapes of physics objects created inside the block
+    and add them all to the physics space in one call when the block ends.
+    """
+    global _deferred_adds
+    _deferred_adds = []
+    try:
+        yield
+    finally:
+        pending, _deferred_adds = _deferred_adds, None
+        if pending:
+            physics_space.add(*pending)
+
+
+def queue_static_reindex(body):
+    """
+    Mark a static body as moved so its shapes get reindexed before the next step.
+    :param body: The static pymunk body that moved or changed shape.
+    """
+    _pending_static_bodies.add(body)
+    _changed_bodies.add(body)
+
+
+def flush_static_reindex():
+    """
+    Reindex the shapes of every static body that moved since the last flush.
+    """
+    if not _pending_static_bodies:
+        return
+    for body in _pending_static_bodies:
+        # Hidden or removed sprites are no longer in the space.
+        if body.space is physics_space:
+            physics_space.reindex_shapes_for_body(body)
+    _pending_static_bodies.clear()
+
+
+def step_physics(dt):
+    """
+    Advance the physics simulation by one step.
+    :param dt: The length of the step in seconds.
+    """
+    global _step_count
+    # static sprites moved since the last step are reindexed once, right before it
+    flush_static_reindex()
+    physics_space.step(dt)
+    _step_count += 1
+    _changed_bodies.clear()
+
+
 def set_gravity(vertical=-100, horizontal=None):
     """
     Set the gravity of the game.
@@ -310,3 +646,108 @@ def set_physics_simulation_steps(num_steps: int) -> None:
     :param num_steps: The number of simulation steps.
     """
     globals_list.num_sim_steps = num_steps
+
+
+def set_physics_threads(num_threads: int) -> None:
+    """
+    Set the number of threads the physics engine uses to solve each step.
+    pymunk uses at most 2 threads, and always 1 on Windows.
+    :param num_threads: The number of threads.
+    """
+    if num_threads < 1:
+        raise ValueError("The number of physics threads must be at least 1.")
+    if not _THREADED_SOLVER:
+        if num_threads > 1:
+            _logger.warning("The threaded physics solver is not available here.")
+        return
+    physics_space.threads = num_threads
+
+
+# The values snapshot() saves for every sprite, in order.
+_SNAPSHOT_FIELDS = (
+    "x",
+    "y",
+    "angle",
+    "size",
+    "transparency",
+    "is_hidden",
+    "x_speed",
+    "y_speed",
+    "angular_velocity",
+)
+
+
+@dataclass
+class PhysicsSnapshot:
+    """The state of every sprite at one moment, see snapshot()."""
+
+    sprites: list
+    # one row of _SNAPSHOT_FIELDS per sprite, in the order of sprites
+    values: _array
+
+
+def snapshot():
+    """
+    Save where every sprite is, how it looks and how it moves, so the game can
+    go back to this moment with restore().
+    :return: A PhysicsSnapshot.
+    """
+    sprites = list(globals_list.sprites_group)
+    values = _array("d")
+    for sprite in sprites:
+        if sprite._physics is None:
+            speeds = (0.0, 0.0, 0.0)
+        else:
+            body = sprite._physics._pymunk_body
+            speeds = (body.velocity.x, body.velocity.y, body.angular_velocity)
+        values.extend(
+            (
+                sprite._x,
+                sprite._y,
+                sprite._angle,
+                sprite._size,
+                sprite._transparency,
+                sprite._is_hidden,
+                *speeds,
+            )
+        )
+    return PhysicsSnapshot(sprites, values)
+
+
+def _restore_body(physics, position, angle, speed, angular_velocity):
+    body = physics._pymunk_body
+    body.position = position
+    body.angle = _math.radians(angle)
+    physics._x_speed, physics._y_speed = speed
+    if body.body_type == _pymunk.Body.STATIC:
+        queue_static_reindex(body)
+    else:
+        body.velocity = speed
+        body.angular_velocity = angular_velocity
+        _changed_bodies.add(body)
+
+
+def restore(state):
+    """
+    Put every sprite back the way it was when a snapshot was taken. Sprites are
+    changed in place, so their callbacks stay as they are. Sprites removed since
+    the snapshot stay removed, and sprites made since are left alone.
+    :param state: A PhysicsSnapshot from snapshot().
+    """
+    stride = len(_SNAPSHOT_FIELDS)
+    values = state.values
+    for index, sprite in enumerate(state.sprites):
+        if not sprite.alive():
+            continue
+        x, y, angle, size, transparency, is_hidden, x_speed, y_speed, spin = values[
+            index * stride : (index + 1) * stride
+        ]
+        if sprite._size != size:
+            sprite.size = size
+        sprite._transparency = transparency
+        sprite._x, sprite._y, sprite._angle = x, y, angle
+
+        if sprite._physics is not None:
+            _restore_body(sprite._physics, (x, y), angle, (x_speed, y_speed), spin)
+
+        sprite.is_hidden = bool(is_hidden)
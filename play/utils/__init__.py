@@ -1,8 +1,8 @@
 """A bunch of random math functions."""
 
+import sys
 import warnings
 from functools import wraps
-import inspect
 from typing import Sequence
 
 import pygame
@@ -134,12 +134,11 @@ You can find the RGB form of a color on websites like this: https://www.rapidtab
         ) from exc
 
 
-def is_called_from_pygame():
-    """Check if the current method is being called from pygame's internal code."""
-    stack = inspect.stack()
-
-    for frame_info in stack:
-        filename = frame_info.filename
-        if "pygame" in filename and "site-packages" in filename:
-            return True
-    return False
+def is_called_from_pygame(depth=2):
+    """Check if the current method is being called from pygame's internal code.
+    Only the direct caller's frame is looked at, so this stays cheap on the
+    group operations every new or removed sprite goes through.
+    :param depth: How many frames above this function the caller is.
+    :return: True if the caller is a pygame module."""
+    module = sys._getframe(depth).f_globals.get("__name__", "")
+    return module == "pygame" or module.startswith("pygame.")
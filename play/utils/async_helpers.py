@@ -5,40 +5,53 @@ import warnings as _warnings
 
 from ..io.logging import play_logger
 
+# The warnings.showwarning that was in place before _check_missing_awaits()
+_original_showwarning = None  # pylint: disable=invalid-name
 
-def _raise_on_await_warning(func):
+
+def _show_warning(message, category, filename, lineno, file=None, line=None):
     """
     If someone doesn't put 'await' before functions that require 'await'
-    like play.timer() or play.animate(), raise an exception.
-    :param func: A function that may or may not be async
-    """
-
-    async def raise_on_warning(*args, **kwargs):
-        with _warnings.catch_warnings(record=True) as warnings:
-            await func(*args, **kwargs)
-            for warning in warnings:
-                str_message = warning.message.args[
-                    0
-                ]  # e.g. "coroutine 'timer' was never awaited"
-                if "was never awaited" in str_message:
-                    function_name = str_message.split("'")[1]
-                    play_logger.warning(
-                        """Looks like you forgot to put "await" before play.%s """
-                        + """on line %s of file %s.\n"""
-                        + """To fix this, just add the word 'await' before play. %s """
-                        + """on line %s of file %s in the function %s.""",
-                        function_name,
-                        warning.lineno,
-                        warning.filename,
-                        function_name,
-                        warning.lineno,
-                        warning.filename,
-                        func.__name__,
-                    )
-                play_logger.warning(str(warning.message))
-
-    raise_on_warning.original_function = func
-    return raise_on_warning
+    like play.timer() or play.animate(), tell them how to fix it.
+    Every other warning is shown as usual.
+    """
+    str_message = str(message)  # e.g. "coroutine 'timer' was never awaited"
+    if issubclass(category, RuntimeWarning) and "was never awaited" in str_message:
+        function_name = str_message.split("'")[1]
+        play_logger.warning(
+            """Looks like you forgot to put "await" before play.%s """
+            + """on line %s of file %s.\n"""
+            + """To fix this, just add the word 'await' before play. %s """
+            + """on line %s of file %s.""",
+            function_name,
+            lineno,
+            filename,
+            function_name,
+            lineno,
+            filename,
+        )
+        return
+    _original_showwarning(message, category, filename, lineno, file, line)
+
+
+def _check_missing_awaits():
+    """
+    Report forgotten awaits through the warnings machinery once, instead of
+    catching warnings around every call of every callback.
+    """
+    global _original_showwarning
+    if _warnings.showwarning is not _show_warning:
+        _original_showwarning = _warnings.showwarning
+        _warnings.showwarning = _show_warning
+
+
+def is_sync_callback(async_callback):
+    """
+    Check if a function from make_async() was a plain function, which never
+    awaits, so it can run right away instead of in its own task.
+    :param async_callback: A function returned by make_async().
+    """
+    return hasattr(async_callback, "original_function")
 
 
 def make_async(func):
@@ -47,10 +60,10 @@ def make_async(func):
     Used mainly in decorators like @repeat_forever.
     :param func: A function that may or may not be async.
     """
+    _check_missing_awaits()
     if _inspect.iscoroutinefunction(func):
-        return _raise_on_await_warning(func)
+        return func
 
-    @_raise_on_await_warning
     async def async_func(*args, **kwargs):
         return func(*args, **kwargs)
 
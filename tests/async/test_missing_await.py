@@ -0,0 +1,58 @@
+"""Tests for the hint shown when a callback forgets to await play.timer()."""
+
+import logging
+import warnings
+
+import pytest
+
+
+def test_forgotten_await_is_explained(caplog):
+    """A coroutine that is never awaited logs how to fix it."""
+    import play
+
+    frames = [0]
+
+    @play.repeat_forever
+    async def forgetful():
+        frames[0] += 1
+        play.timer(seconds=0.01)  # pylint: disable=unused-coroutine
+        if frames[0] == 3:
+            play.stop_program()
+
+    with caplog.at_level(logging.WARNING, logger="play"):
+        play.start_program()
+
+    assert any("forgot to put" in r.message for r in caplog.records)
+
+
+def test_callbacks_run_without_catching_warnings(monkeypatch):
+    """Running a callback doesn't enter warnings.catch_warnings."""
+    import asyncio
+    from play.callback.callback_helpers import run_async_callback
+    from play.utils.async_helpers import make_async
+
+    entered = []
+    monkeypatch.setattr(
+        warnings.catch_warnings, "__enter__", lambda self: entered.append(self)
+    )
+
+    ran = []
+    callback = make_async(lambda: ran.append(True))
+    asyncio.run(run_async_callback(callback, [], []))
+
+    assert ran == [True]
+    assert not entered
+
+
+def test_other_warnings_are_shown_as_usual():
+    """Warnings that are not about a missing await are left alone."""
+    from play.utils.async_helpers import make_async
+
+    make_async(lambda: None)
+
+    with pytest.warns(UserWarning, match="something else"):
+        warnings.warn("something else", UserWarning)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
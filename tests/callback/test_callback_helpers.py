@@ -0,0 +1,67 @@
+"""Tests for running callbacks with the arguments they accept."""
+
+import inspect
+
+import pytest
+
+
+def _count_argspec_calls(monkeypatch):
+    calls = []
+    original = inspect.getfullargspec
+
+    def counting(func):
+        calls.append(func)
+        return original(func)
+
+    monkeypatch.setattr(inspect, "getfullargspec", counting)
+    return calls
+
+
+def test_signature_is_inspected_once(monkeypatch):
+    """Running a callback many times only reads its signature the first time."""
+    import asyncio
+    from play.callback.callback_helpers import run_async_callback
+    from play.utils.async_helpers import make_async
+
+    received = []
+
+    def on_key(key):
+        received.append(key)
+
+    callback = make_async(on_key)
+    calls = _count_argspec_calls(monkeypatch)
+
+    async def run_many():
+        for key in "abcde":
+            await run_async_callback(callback, [], ["key"], key)
+
+    asyncio.run(run_many())
+
+    assert received == list("abcde")
+    assert calls == [on_key]
+
+
+def test_wrong_signature_still_raises_every_time():
+    """A callback with too many arguments is rejected, also once it's been checked."""
+    import asyncio
+    from play.callback.callback_helpers import run_async_callback
+    from play.utils.async_helpers import make_async
+
+    callback = make_async(lambda a, b: None)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            asyncio.run(run_async_callback(callback, [], ["key"], "a"))
+
+
+def test_sync_function_is_rejected():
+    """Only async functions can be run as callbacks."""
+    import asyncio
+    from play.callback.callback_helpers import run_async_callback
+
+    with pytest.raises(ValueError):
+        asyncio.run(run_async_callback(lambda: None, [], []))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -207,5 +207,95 @@ def test_run_callbacks_inline_skips_missing_type():
     loop.close()
 
 
+def _sync_callback(received, **properties):
+    async def callback(state):
+        received.append((callback, state))
+
+    callback.is_sync = True
+    for name, value in properties.items():
+        setattr(callback, name, value)
+    return callback
+
+
+def test_dispatch_table_is_reused_until_callbacks_change():
+    """Dispatching builds its table once, adding a callback rebuilds it."""
+    import asyncio
+    from play.callback import CallbackManager, CallbackType
+
+    cm = CallbackManager()
+    received = []
+    first = _sync_callback(received)
+    cm.add_callback(CallbackType.WHILE_KEY_PRESSED, first, "a")
+
+    loop = asyncio.new_event_loop()
+    for _ in range(3):
+        loop.run_until_complete(
+            cm.run_callbacks_with_filter(
+                CallbackType.WHILE_KEY_PRESSED, {"a"}, required_args=["key"]
+            )
+        )
+    table = cm._dispatch_tables[(CallbackType.WHILE_KEY_PRESSED, ())]
+
+    second = _sync_callback(received)
+    cm.add_callback(CallbackType.WHILE_KEY_PRESSED, second, "any")
+    loop.run_until_complete(
+        cm.run_callbacks_with_filter(
+            CallbackType.WHILE_KEY_PRESSED, {"a"}, required_args=["key"]
+        )
+    )
+    loop.close()
+
+    assert received == [(first, "a")] * 4 + [(second, "a")]
+    assert cm._dispatch_tables[(CallbackType.WHILE_KEY_PRESSED, ())] is not table
+
+
+def test_dispatch_table_filters_by_property():
+    """Callbacks only run for the controller they were registered for."""
+    import asyncio
+    from play.callback import CallbackManager, CallbackType
+
+    cm = CallbackManager()
+    received = []
+    pad_0 = _sync_callback(received, controller=0)
+    pad_1 = _sync_callback(received, controller=1)
+    cm.add_callback(CallbackType.WHEN_CONTROLLER_BUTTON_PRESSED, pad_0, 3)
+    cm.add_callback(CallbackType.WHEN_CONTROLLER_BUTTON_PRESSED, pad_1, 3)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(
+        cm.run_callbacks_with_filter(
+            CallbackType.WHEN_CONTROLLER_BUTTON_PRESSED,
+            {3},
+            required_args=["button"],
+            property_filter={"controller": 1},
+        )
+    )
+    loop.close()
+
+    assert received == [(pad_1, 3)]
+
+
+def test_combo_callbacks_run_for_exact_combination():
+    """A combo_key() callback gets the whole set of active states."""
+    import asyncio
+    from play.callback import CallbackManager, CallbackType
+
+    cm = CallbackManager()
+    received = []
+    combo = _sync_callback(received)
+    cm.add_callback(CallbackType.PRESSED_KEYS, combo, cm.combo_key(["a", "b"]))
+
+    loop = asyncio.new_event_loop()
+    for pressed in ({"a"}, {"a", "b"}, {"a", "b", "c"}):
+        loop.run_until_complete(
+            cm.run_callbacks_with_filter(
+                CallbackType.PRESSED_KEYS, pressed, required_args=["key"]
+            )
+        )
+    loop.close()
+
+    assert received == [(combo, {"a", "b"})]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
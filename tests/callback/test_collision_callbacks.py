@@ -342,5 +342,80 @@ def test_collision_registry_valid_after_can_move_change():
     assert ct in collision_registry.callbacks[True]
 
 
+def test_handler_installed_only_for_registered_pairs():
+    """Registering when_touching installs a handler for exactly that pair."""
+    import play
+    from play.callback.collision_callbacks import collision_registry
+
+    ball = play.new_circle(x=0, y=0, radius=10)
+    paddle = play.new_box(x=100, y=0, width=10, height=50)
+    other = play.new_box(x=-100, y=0, width=10, height=50)
+
+    @ball.when_touching(paddle)
+    def on_touch():
+        pass
+
+    pair = frozenset(
+        (
+            ball.physics._pymunk_shape.collision_type,
+            paddle.physics._pymunk_shape.collision_type,
+        )
+    )
+    assert pair in collision_registry.handled_pairs
+    assert not any(
+        other.physics._pymunk_shape.collision_type in handled
+        for handled in collision_registry.handled_pairs
+    )
+
+
+def test_unregistered_pairs_do_not_call_python_handler(monkeypatch):
+    """Contacts between sprites without callbacks stay inside pymunk."""
+    import play
+    from play.callback.collision_callbacks import collision_registry
+
+    seen = []
+    original = collision_registry._handle_collision
+
+    def counting_handler(arbiter, space, data):
+        seen.append(frozenset(shape.collision_type for shape in arbiter.shapes))
+        return original(arbiter, space, data)
+
+    monkeypatch.setattr(collision_registry, "_handle_collision", counting_handler)
+
+    ball = play.new_circle(x=-100, y=0, radius=10)
+    paddle = play.new_box(x=0, y=0, width=10, height=80)
+    ball.start_physics(obeys_gravity=False, x_speed=300)
+    paddle.start_physics(can_move=False)
+
+    crate_a = play.new_box(x=-50, y=200, width=20, height=20)
+    crate_b = play.new_box(x=50, y=200, width=20, height=20)
+    crate_a.start_physics(obeys_gravity=False, x_speed=300)
+    crate_b.start_physics(obeys_gravity=False, x_speed=-300)
+
+    hits = [0]
+    frames = [0]
+
+    @ball.when_touching(paddle)
+    def on_touch():
+        hits[0] += 1
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if frames[0] > 30:
+            play.stop_program()
+
+    play.start_program()
+
+    registered = frozenset(
+        (
+            ball.physics._pymunk_shape.collision_type,
+            paddle.physics._pymunk_shape.collision_type,
+        )
+    )
+    assert hits[0] > 0
+    assert seen and all(pair == registered for pair in seen)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
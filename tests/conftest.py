@@ -190,6 +190,7 @@ def clean_play_state(request):
 
     collision_registry.callbacks = {True: {}, False: {}}
     collision_registry.shape_registry.clear()
+    collision_registry.tag_callbacks = {True: {}, False: {}}
 
     from play.core import keyboard_state, mouse_state
 
@@ -195,5 +195,34 @@ def test_frame_rate_setting():
     assert result[0] == 60  # default frame rate
 
 
+def test_game_loop_is_one_long_running_task(monkeypatch):
+    """Frames are run by one game_loop task, not a new task per frame."""
+    import play
+    from play.loop import get_loop
+
+    loop = get_loop()
+    names = []
+    original = loop.create_task
+
+    def recording_create_task(coro, **kwargs):
+        names.append(getattr(coro, "__name__", None))
+        return original(coro, **kwargs)
+
+    monkeypatch.setattr(loop, "create_task", recording_create_task)
+
+    frame_count = [0]
+
+    @play.repeat_forever
+    def count_frames():
+        frame_count[0] += 1
+        if frame_count[0] == 10:
+            play.stop_program()
+
+    play.start_program()
+
+    assert frame_count[0] == 10
+    assert names.count("game_loop") == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,57 @@
+"""Tests for waiting for frames with play.animate() and play.next_frame()."""
+
+import pytest
+
+
+def test_animate_resumes_once_per_frame():
+    """A loop awaiting play.animate() runs once for every frame drawn."""
+    import play
+
+    frames = [0]
+    loop_runs = [0]
+
+    @play.when_program_starts
+    async def spin():
+        while True:
+            loop_runs[0] += 1
+            await play.animate()
+
+    @play.repeat_forever
+    def count_frames():
+        frames[0] += 1
+        if frames[0] == 20:
+            play.stop_program()
+
+    play.start_program()
+
+    assert abs(loop_runs[0] - frames[0]) <= 1
+
+
+def test_next_frame_waits_for_frames():
+    """play.next_frame(n) resumes after n frames."""
+    import play
+
+    frames = [0]
+    resumed_at = []
+
+    @play.when_program_starts
+    async def wait():
+        start = frames[0]
+        await play.next_frame(5)
+        resumed_at.append(frames[0] - start)
+        await play.next_frame()
+        resumed_at.append(frames[0] - start)
+
+    @play.repeat_forever
+    def count_frames():
+        frames[0] += 1
+        if frames[0] == 10:
+            play.stop_program()
+
+    play.start_program()
+
+    assert resumed_at == [5, 6]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -426,3 +426,43 @@ def test_controller_state_any_false_after_all_buttons_released():
 
     # Clean up
     controller_state.buttons_pressed.clear()
+
+
+def test_sync_while_key_pressed_runs_without_tasks(monkeypatch):
+    """A plain def callback runs inside handle_keyboard, an async one gets a task."""
+    import asyncio
+    import play
+    from play.core.keyboard_loop import handle_keyboard
+    from play.io.keypress import keyboard_state
+    from play.loop import get_loop
+
+    held = []
+
+    @play.while_key_pressed("up")
+    def on_up(key):
+        held.append(key)
+
+    @play.while_key_pressed("down")
+    async def on_down(key):
+        await play.timer(seconds=0)
+
+    loop = get_loop()
+    tasks = []
+    original = loop.create_task
+    monkeypatch.setattr(
+        loop,
+        "create_task",
+        lambda coro: tasks.append(coro.cr_frame.f_locals.get("active_key"))
+        or original(coro),
+    )
+
+    keyboard_state.pressed.update({"up", "down"})
+    for _ in range(3):
+        loop.run_until_complete(handle_keyboard())
+        assert held[-1] == "up"
+    keyboard_state.pressed.clear()
+    loop.run_until_complete(asyncio.sleep(0.05))
+
+    assert held == ["up"] * 3
+    assert "down" in tasks
+    assert "up" not in tasks
@@ -0,0 +1,98 @@
+"""Tests for creating many sprites at once with new_boxes() and new_circles()."""
+
+import pytest
+import pymunk
+
+
+def test_new_boxes_creates_sprites_with_per_sprite_values():
+    """Single values apply to every box, lists give one value per box."""
+    import play
+    from play.globals import globals_list
+    from play.physics import physics_space
+
+    boxes = play.new_boxes(
+        [(0, 0), (50, 10), (100, 20)],
+        color=["red", "green", "blue"],
+        width=20,
+        height=10,
+    )
+
+    assert [(box.x, box.y) for box in boxes] == [(0, 0), (50, 10), (100, 20)]
+    assert [box.color for box in boxes] == ["red", "green", "blue"]
+    assert all(box.width == 20 and box.height == 10 for box in boxes)
+    for box in boxes:
+        assert box in globals_list.sprites_group
+        assert box.physics._pymunk_shape in physics_space.shapes
+
+
+def test_new_boxes_adds_to_space_in_one_call(monkeypatch):
+    """All bodies and shapes are added to the physics space together."""
+    import play
+    from play.physics import physics_space
+
+    calls = []
+    original = physics_space.add
+    monkeypatch.setattr(
+        physics_space, "add", lambda *objs: calls.append(len(objs)) or original(*objs)
+    )
+
+    play.new_boxes(
+        [(i * 10, 0) for i in range(50)],
+        width=5,
+        height=5,
+        physics={"can_move": False},
+    )
+
+    assert calls == [100]
+
+
+def test_sprites_with_the_same_look_share_a_surface():
+    """One surface is drawn per unique look, and changing one sprite redraws only it."""
+    import play
+
+    circles = play.new_circles(
+        [(0, 0), (30, 0), (60, 0)], radius=10, color=["red", "red", "blue"]
+    )
+
+    assert circles[0].image is circles[1].image
+    assert circles[0].image is not circles[2].image
+
+    circles[0].color = "green"
+    circles[0].update()
+
+    assert circles[0].image is not circles[1].image
+    assert circles[1].image.get_at((10, 10))[:3] == (255, 0, 0)
+
+
+def test_new_circles_physics_options():
+    """physics holds start_physics() arguments used by every circle."""
+    import play
+
+    balls = play.new_circles(
+        [(0, 0), (40, 0)], radius=5, physics={"can_move": False, "bounciness": 0.5}
+    )
+
+    for ball in balls:
+        assert ball.physics._pymunk_body.body_type == pymunk.Body.STATIC
+        assert ball.physics.bounciness == 0.5
+
+
+def test_rgb_tuple_is_one_color_for_all():
+    """Tuples are single values, so RGB colors are not split across sprites."""
+    import play
+
+    boxes = play.new_boxes([(0, 0), (10, 0), (20, 0)], color=(255, 0, 0))
+
+    assert all(box.color == (255, 0, 0) for box in boxes)
+
+
+def test_wrong_number_of_values_raises():
+    """A list that does not match the number of positions is an error."""
+    import play
+
+    with pytest.raises(ValueError):
+        play.new_boxes([(0, 0), (10, 0)], color=["red"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
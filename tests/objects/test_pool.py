@@ -0,0 +1,105 @@
+"""Tests for play.pool(), which reuses sprites instead of making new ones."""
+
+import pytest
+
+
+def test_pool_builds_hidden_sprites_up_front():
+    """All sprites are made when the pool is, and start hidden."""
+    import play
+
+    made = []
+
+    def make_bullet():
+        bullet = play.new_box(width=4, height=10)
+        made.append(bullet)
+        return bullet
+
+    bullets = play.pool(make_bullet, size=5)
+
+    assert len(made) == 5
+    assert all(bullet.is_hidden for bullet in made)
+    assert not bullets.in_use
+
+
+def test_acquire_and_release_reuse_the_same_sprites():
+    """Sprites are shown at the requested position and hidden again on release."""
+    import play
+
+    bullets = play.pool(lambda: play.new_box(width=4, height=10), size=2)
+
+    first = bullets.acquire(x=10, y=20)
+    assert not first.is_hidden
+    assert (first.x, first.y) == (10, 20)
+    assert bullets.in_use == [first]
+
+    bullets.release(first)
+    assert first.is_hidden
+    assert not bullets.in_use
+
+    again = bullets.acquire(x=-5, y=0)
+    assert again is first
+    assert (again.x, again.y) == (-5, 0)
+
+
+def test_acquire_restores_starting_speeds():
+    """A reused sprite moves with the speeds it was made with, not leftover ones."""
+    import play
+    from play.physics import physics_space
+
+    def make_bullet():
+        bullet = play.new_circle(radius=3)
+        bullet.start_physics(obeys_gravity=False, y_speed=300)
+        return bullet
+
+    bullets = play.pool(make_bullet, size=1)
+    bullet = bullets.acquire(x=0, y=0)
+    assert bullet.physics._pymunk_shape in physics_space.shapes
+
+    bullet.physics.y_speed = -50
+    bullet.physics.x_speed = 80
+    bullets.release(bullet)
+    assert bullet.physics._pymunk_shape not in physics_space.shapes
+
+    bullet = bullets.acquire(x=0, y=0)
+    assert tuple(bullet.physics._pymunk_body.velocity) == (0, 300)
+
+
+def test_pool_grows_when_empty_and_keeps_callbacks():
+    """Running out makes a new sprite, and collision callbacks survive reuse."""
+    import play
+    from play.callback import callback_manager, CallbackType
+
+    target = play.new_box(x=200, y=0)
+    bullets = play.pool(lambda: play.new_box(width=4, height=10), size=1)
+    bullet = bullets.acquire()
+
+    @bullet.when_touching(target)
+    def hit():
+        pass
+
+    bullets.release(bullet)
+    bullets.acquire()
+    extra = bullets.acquire()
+
+    assert extra is not bullet
+    assert len(bullets.in_use) == 2
+    assert (
+        len(callback_manager.get_callback(CallbackType.WHEN_TOUCHING, id(bullet))) == 1
+    )
+
+
+def test_release_checks_the_sprite_belongs_to_the_pool():
+    """Releasing twice is harmless, releasing a stranger is an error."""
+    import play
+
+    bullets = play.pool(lambda: play.new_box(), size=1)
+    bullet = bullets.acquire()
+    bullets.release(bullet)
+    bullets.release(bullet)
+
+    with pytest.raises(ValueError):
+        bullets.release(play.new_box())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -50,3 +50,23 @@ def test_remove_internal_warns_when_called_directly():
     assert len(w) >= 1
     assert any(issubclass(warning.category, UserWarning) for warning in w)
     assert any("remove" in str(warning.message).lower() for warning in w)
+
+
+def test_group_operations_do_not_warn_or_walk_the_stack(monkeypatch):
+    """Sprites joining and leaving groups through pygame don't inspect the stack."""
+    import inspect
+
+    def fail():
+        raise AssertionError("inspect.stack() should not be used")
+
+    monkeypatch.setattr(inspect, "stack", fail)
+    group = pygame.sprite.Group()
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        box = play.new_box(color="red", x=0, y=0, width=10, height=10)
+        group.add(box)
+        group.remove(box)
+        box.remove()
+
+    assert not [warning for warning in w if issubclass(warning.category, UserWarning)]
@@ -0,0 +1,140 @@
+"""Tests for collision layers (physics.layer and physics.collides_with)."""
+
+import pytest
+import pymunk
+
+
+def test_default_filter_collides_with_everything():
+    import play
+    from play.physics import ALL_LAYERS
+
+    box = play.new_box()
+    box.start_physics()
+
+    shape_filter = box.physics._pymunk_shape.filter
+    assert shape_filter.categories == ALL_LAYERS
+    assert shape_filter.mask == pymunk.ShapeFilter.ALL_MASKS()
+    assert box.physics.layer is None
+    assert box.physics.collides_with is None
+
+
+def test_layer_and_collides_with_set_filter():
+    import play
+    from play.physics import layer_category
+
+    bullet = play.new_circle(radius=5)
+    bullet.start_physics(layer="bullets", collides_with=["enemies", "walls"])
+
+    shape_filter = bullet.physics._pymunk_shape.filter
+    assert shape_filter.categories == layer_category("bullets")
+    assert shape_filter.mask & layer_category("enemies")
+    assert shape_filter.mask & layer_category("walls")
+    assert not shape_filter.mask & layer_category("bullets")
+    assert bullet.physics.collides_with == ["enemies", "walls"]
+
+
+def test_collides_with_accepts_single_name():
+    import play
+
+    box = play.new_box()
+    box.physics.collides_with = "enemies"
+
+    assert box.physics.collides_with == ["enemies"]
+
+
+def test_layer_survives_physics_rebuild():
+    """Toggling can_move rebuilds the shape; the filter must be kept."""
+    import play
+    from play.physics import layer_category
+
+    box = play.new_box()
+    box.start_physics()
+    box.physics.layer = "platforms"
+    box.physics.can_move = False
+
+    assert box.physics._pymunk_shape.filter.categories == layer_category("platforms")
+
+
+def test_too_many_layers_raises(monkeypatch):
+    import play.physics
+    from play.physics import layer_category
+
+    monkeypatch.setattr(play.physics, "_layers", {"walls": 1})
+
+    with pytest.raises(ValueError):
+        for i in range(40):
+            layer_category(f"layer {i}")
+    assert len(play.physics._layers) == 31
+
+
+def test_same_layer_sprites_pass_through_each_other():
+    import play
+
+    frames = [0]
+    a = play.new_circle(x=-100, y=0, radius=10)
+    b = play.new_circle(x=100, y=0, radius=10)
+    a.start_physics(obeys_gravity=False, x_speed=200, layer="bullets", collides_with=[])
+    b.start_physics(
+        obeys_gravity=False, x_speed=-200, layer="bullets", collides_with=[]
+    )
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if frames[0] > 70:
+            play.stop_program()
+
+    play.start_program()
+
+    assert a.x > 100, "bullets should not block each other"
+    assert b.x < -100
+
+
+def test_layered_sprite_hits_listed_layer():
+    import play
+
+    hits = [0]
+    frames = [0]
+    bullet = play.new_circle(x=-100, y=0, radius=10)
+    enemy = play.new_box(x=100, y=0, width=20, height=60)
+    bullet.start_physics(
+        obeys_gravity=False, x_speed=300, layer="bullets", collides_with="enemies"
+    )
+    enemy.start_physics(can_move=False, layer="enemies")
+
+    @bullet.when_touching(enemy)
+    def hit():
+        hits[0] += 1
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if hits[0] or frames[0] > 60:
+            play.stop_program()
+
+    play.start_program()
+
+    assert hits[0] > 0
+
+
+def test_collides_with_nothing_passes_through_walls_but_is_queryable():
+    import play
+
+    frames = [0]
+    ghost = play.new_circle(x=350, y=0, radius=10)
+    ghost.start_physics(obeys_gravity=False, x_speed=300, collides_with=[])
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if frames[0] > 30:
+            play.stop_program()
+
+    play.start_program()
+
+    assert ghost.x > play.screen.right
+    assert play.sprites_at((ghost.x, ghost.y)) == [ghost]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""Tests for fast_moving sprites that must not pass through thin objects."""
+
+import pytest
+
+
+def _fire(ball, paddle, fast_moving, **kwargs):
+    from play.physics import step_physics
+
+    ball.start_physics(
+        obeys_gravity=False, x_speed=3000, fast_moving=fast_moving, **kwargs
+    )
+    for _ in range(10):
+        step_physics(1 / 60)
+    return ball.physics._pymunk_body.position.x
+
+
+def test_fast_ball_passes_through_thin_paddle_without_flag():
+    """Without fast_moving, one step carries the ball past the paddle."""
+    import play
+
+    ball = play.new_circle(x=0, y=0, radius=5)
+    paddle = play.new_box(x=100, y=0, width=10, height=100)
+    paddle.start_physics(can_move=False)
+
+    assert _fire(ball, paddle, fast_moving=False) > 100
+
+
+def test_fast_moving_ball_bounces_off_thin_paddle():
+    """With fast_moving, the ball is stopped at the paddle and bounces back."""
+    import play
+
+    ball = play.new_circle(x=0, y=0, radius=5)
+    paddle = play.new_box(x=100, y=0, width=10, height=100)
+    paddle.start_physics(can_move=False)
+
+    assert _fire(ball, paddle, fast_moving=True) < 100
+    assert ball.physics._pymunk_body.velocity.x < 0
+
+
+def test_fast_moving_respects_collision_layers():
+    """Shapes in layers the ball does not collide with are not swept against."""
+    import play
+
+    ball = play.new_circle(x=0, y=0, radius=5)
+    paddle = play.new_box(x=100, y=0, width=10, height=100)
+    paddle.start_physics(can_move=False, layer="paddles")
+
+    assert _fire(ball, paddle, fast_moving=True, collides_with=[]) > 100
+
+
+def test_fast_moving_ball_fires_when_touching():
+    """The swept contact is a real collision, so when_touching callbacks run."""
+    import play
+
+    hits = []
+    frames = [0]
+
+    ball = play.new_circle(x=0, y=0, radius=5)
+    ball.start_physics(obeys_gravity=False, x_speed=3000, fast_moving=True)
+    paddle = play.new_box(x=100, y=0, width=10, height=100)
+    paddle.start_physics(can_move=False)
+
+    @ball.when_touching(paddle)
+    def on_hit():
+        hits.append(1)
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if hits or frames[0] > 20:
+            play.stop_program()
+
+    play.set_physics_simulation_steps(1)
+    try:
+        play.start_program()
+    finally:
+        play.set_physics_simulation_steps(10)
+
+    assert hits
+
+
+def test_fast_moving_setter_and_clone():
+    """The flag can be toggled after start_physics and is kept by clones."""
+    import play
+
+    ball = play.new_circle(radius=5)
+    ball.start_physics(obeys_gravity=False)
+    assert not ball.physics.fast_moving
+
+    ball.physics.fast_moving = True
+    assert ball.physics.clone(ball).fast_moving
+
+    ball.physics.fast_moving = False
+    body = ball.physics._pymunk_body
+    body.velocity = (60, 0)
+    body.position_func(body, 1)
+    assert body.position.x == pytest.approx(60)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""Tests that sprites only get a physics body once something needs one."""
+
+import math
+
+import pytest
+
+
+def test_decorative_sprites_have_no_body():
+    """Sprites that are only drawn never add anything to the physics space."""
+    import play
+    from play.physics import physics_space
+
+    shapes_before = len(physics_space.shapes)
+    label = play.new_text(words="Score: 0", x=0, y=250)
+    box = play.new_box(x=100, y=100, width=20, height=20)
+
+    frames = [0]
+
+    @play.repeat_forever
+    def animate():
+        frames[0] += 1
+        label.words = f"Score: {frames[0]}"
+        box.x += 1
+        box.angle += 5
+        if frames[0] > 5:
+            play.stop_program()
+
+    play.start_program()
+
+    assert label._physics is None
+    assert box._physics is None
+    assert len(physics_space.shapes) == shapes_before
+
+
+def test_physics_is_created_on_first_use_where_the_sprite_is():
+    """Accessing physics gives a body at the sprite's current position, angle and size."""
+    import play
+    from play.physics import physics_space
+
+    box = play.new_box(width=20, height=10)
+    box.x = 50
+    box.y = -30
+    box.angle = 90
+    box.size = 200
+
+    physics = box.physics
+
+    assert physics._pymunk_shape in physics_space.shapes
+    assert tuple(physics._pymunk_body.position) == (50, -30)
+    assert physics._pymunk_body.angle == pytest.approx(math.pi / 2)
+    xs = [v.x for v in physics._pymunk_shape.get_vertices()]
+    assert max(xs) - min(xs) == pytest.approx(40)
+
+
+def test_hidden_sprite_gets_paused_physics():
+    """A hidden sprite's body is created outside the space, like hide() does."""
+    import play
+    from play.physics import physics_space
+
+    box = play.new_box()
+    box.hide()
+
+    assert box.physics._pymunk_shape not in physics_space.shapes
+
+    box.show()
+    assert box.physics._pymunk_shape in physics_space.shapes
+
+
+def test_clicks_only_create_physics_for_sprites_under_the_mouse():
+    """The drawn rect is checked first, so far away sprites stay without physics."""
+    import play
+
+    button = play.new_box(x=0, y=0, width=100, height=40)
+    label = play.new_text(words="far away", x=300, y=250)
+    button.update()
+    label.update()
+
+    assert not play.mouse.is_touching(label)
+    assert label._physics is None
+
+    play.mouse.x, play.mouse.y = 10, 5
+    assert play.mouse.is_touching(button)
+    assert button._physics is not None
+
+
+def test_spatial_queries_find_sprites_without_physics():
+    """Spatial queries give nearby sprites their physics before asking the space."""
+    import play
+
+    box = play.new_box(x=0, y=0, width=20, height=20)
+    box.update()
+
+    assert play.sprites_at((0, 0)) == [box]
+    assert play.sprites_in_box((-50, -50, 50, 50)) == [box]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""Tests for running the physics solver on more than one thread."""
+
+import sys
+
+import pytest
+
+skip_on_windows = pytest.mark.skipif(
+    sys.platform == "win32", reason="pymunk has no threaded solver on Windows"
+)
+
+
+@skip_on_windows
+def test_set_physics_threads_configures_space(monkeypatch):
+    """The existing space is switched over, so imported references stay valid."""
+    import play
+    from play.physics import physics_space
+
+    monkeypatch.setattr(physics_space, "threads", physics_space.threads)
+
+    play.set_physics_threads(2)
+
+    assert physics_space.threaded
+    assert physics_space.threads == 2
+
+
+@skip_on_windows
+def test_collisions_and_walls_work_with_threads(monkeypatch):
+    """Collision callbacks, walls and sprites keep working on the threaded solver."""
+    import play
+    from play.physics import physics_space
+
+    monkeypatch.setattr(physics_space, "threads", physics_space.threads)
+    play.set_physics_threads(2)
+
+    hits = []
+    walls = []
+    frames = [0]
+
+    ball = play.new_circle(x=0, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=600)
+    paddle = play.new_box(x=100, y=0, width=10, height=100)
+    paddle.start_physics(can_move=False)
+    other = play.new_circle(x=0, y=-100, radius=10)
+    other.start_physics(obeys_gravity=False, y_speed=-600)
+
+    @ball.when_touching(paddle)
+    def on_hit():
+        hits.append(1)
+
+    @other.when_touching_wall
+    def on_wall():
+        walls.append(1)
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if (hits and walls) or frames[0] > 60:
+            play.stop_program()
+
+    play.start_program()
+
+    assert hits
+    assert walls
+
+
+def test_set_physics_threads_rejects_zero():
+    """At least one thread is needed to step the simulation."""
+    import play
+
+    with pytest.raises(ValueError):
+        play.set_physics_threads(0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,128 @@
+"""Tests that resizing a sprite updates its physics shape in place."""
+
+import pytest
+import pymunk
+
+
+def test_box_size_keeps_body_and_shape():
+    """Changing box.size must not create a new pymunk body or shape."""
+    import play
+
+    box = play.new_box(width=40, height=20)
+    box.start_physics(obeys_gravity=False)
+    body = box.physics._pymunk_body
+    shape = box.physics._pymunk_shape
+
+    box.size = 200
+
+    assert box.physics._pymunk_body is body
+    assert box.physics._pymunk_shape is shape
+    xs = [v.x for v in shape.get_vertices()]
+    ys = [v.y for v in shape.get_vertices()]
+    assert max(xs) - min(xs) == pytest.approx(80)
+    assert max(ys) - min(ys) == pytest.approx(40)
+
+
+def test_box_width_and_height_update_vertices():
+    """box.width and box.height resize the existing Poly shape."""
+    import play
+
+    box = play.new_box(width=40, height=20)
+    box.start_physics(obeys_gravity=False)
+    shape = box.physics._pymunk_shape
+
+    box.width = 60
+    box.height = 30
+
+    assert box.physics._pymunk_shape is shape
+    xs = [v.x for v in shape.get_vertices()]
+    ys = [v.y for v in shape.get_vertices()]
+    assert max(xs) - min(xs) == pytest.approx(60)
+    assert max(ys) - min(ys) == pytest.approx(30)
+
+
+def test_circle_radius_and_size_update_radius():
+    """circle.radius and circle.size resize the existing Circle shape."""
+    import play
+
+    circle = play.new_circle(radius=10)
+    circle.start_physics(obeys_gravity=False)
+    shape = circle.physics._pymunk_shape
+
+    circle.radius = 20
+    assert shape.radius == pytest.approx(20)
+
+    circle.size = 50
+    assert circle.physics._pymunk_shape is shape
+    assert shape.radius == pytest.approx(10)
+
+
+def test_resize_recomputes_moment_for_dynamic_body():
+    """A non-stable dynamic body gets a new moment matching its new size."""
+    import play
+
+    circle = play.new_circle(radius=10)
+    circle.start_physics(obeys_gravity=False, mass=5)
+
+    circle.radius = 30
+
+    expected = pymunk.moment_for_circle(5, 0, 30, (0, 0))
+    assert circle.physics._pymunk_body.moment == pytest.approx(expected)
+    assert circle.physics._pymunk_body.mass == 5
+
+
+def test_resize_keeps_collision_type_and_callbacks():
+    """Resizing must not clear collision registrations of the sprite."""
+    import play
+    from play.callback import callback_manager, CallbackType
+
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False)
+    paddle = play.new_box(x=100, width=10, height=50)
+    paddle.start_physics(can_move=False)
+
+    @ball.when_touching(paddle)
+    def on_touch():
+        pass
+
+    collision_type = ball.physics._pymunk_shape.collision_type
+    ball.size = 150
+    paddle.height = 100
+
+    assert ball.physics._pymunk_shape.collision_type == collision_type
+    assert len(callback_manager.get_callback(CallbackType.WHEN_TOUCHING, id(ball))) == 1
+
+
+def test_resized_static_shape_collides_at_new_size():
+    """A static sprite that grows is reindexed so the next step sees its new size."""
+    import play
+
+    wall = play.new_box(x=0, y=0, width=10, height=10)
+    wall.start_physics(can_move=False)
+    ball = play.new_circle(x=40, y=0, radius=5)
+    ball.start_physics(obeys_gravity=False)
+
+    assert not ball.is_touching(wall)
+
+    wall.width = 100
+
+    assert ball.is_touching(wall)
+
+
+def test_resize_while_hidden():
+    """Resizing a hidden sprite works and the shape is restored on show()."""
+    import play
+    from play.physics import physics_space
+
+    box = play.new_box(width=20, height=20)
+    box.hide()
+    box.size = 300
+    box.show()
+
+    assert box.physics._pymunk_shape in physics_space.shapes
+    xs = [v.x for v in box.physics._pymunk_shape.get_vertices()]
+    assert max(xs) - min(xs) == pytest.approx(60)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
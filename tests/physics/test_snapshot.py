@@ -0,0 +1,95 @@
+"""Tests for saving and restoring the state of every sprite."""
+
+import pytest
+
+
+def test_restore_puts_bodies_back():
+    """Positions, angles and speeds are written back to the bodies."""
+    import play
+    from play.physics import snapshot, restore, step_physics
+
+    ball = play.new_circle(x=0, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=50, y_speed=-20)
+    ball.physics._pymunk_body.angular_velocity = 2
+    ball.angle = 30
+    saved = snapshot()
+
+    for _ in range(30):
+        step_physics(1 / 60)
+    ball.physics.x_speed = 0
+
+    restore(saved)
+
+    body = ball.physics._pymunk_body
+    assert (ball.x, ball.y, ball.angle) == (0, 0, 30)
+    assert tuple(body.position) == (0, 0)
+    assert tuple(body.velocity) == (50, -20)
+    assert body.angular_velocity == 2
+    assert ball.physics.x_speed == 50
+
+
+def test_restore_keeps_sprites_and_callbacks(monkeypatch):
+    """Restoring doesn't restart physics, so callbacks keep working."""
+    import play
+    from play.objects import Sprite
+    from play.physics import snapshot, restore
+
+    wall = play.new_box(x=100, y=0, width=10, height=100)
+    wall.start_physics(can_move=False)
+    ball = play.new_circle(x=0, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=400)
+    saved = snapshot()
+
+    hits = [0]
+
+    @ball.when_touching(wall)
+    def hit():
+        hits[0] += 1
+
+    frames = [0]
+
+    @play.repeat_forever
+    def rewind():
+        frames[0] += 1
+        if frames[0] % 30 == 0:
+            restore(saved)
+        if frames[0] == 90:
+            play.stop_program()
+
+    start_calls = []
+    monkeypatch.setattr(Sprite, "start_physics", lambda *a, **k: start_calls.append(a))
+    play.start_program()
+
+    assert hits[0] >= 3
+    assert not start_calls
+
+
+def test_restore_visual_state():
+    """Size, transparency and visibility come back, removed sprites stay removed."""
+    import play
+    from play.globals import globals_list
+    from play.physics import snapshot, restore
+
+    box = play.new_box(width=20, height=20, transparency=80)
+    label = play.new_text(words="hi")
+    gone = play.new_circle()
+    saved = snapshot()
+
+    box.size = 200
+    box.transparency = 10
+    label.hide()
+    label.x = 40
+    gone.remove()
+
+    restore(saved)
+
+    assert box.size == 100
+    assert box.transparency == 80
+    assert label.is_shown
+    assert label.x == 0
+    assert label._physics is None
+    assert gone not in globals_list.sprites_group
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
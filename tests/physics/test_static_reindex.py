@@ -0,0 +1,121 @@
+"""Tests for batched reindexing of static sprites that moved."""
+
+import pytest
+
+
+def test_moving_static_sprite_defers_reindex(monkeypatch):
+    """Setting x/y on a static sprite queues it instead of reindexing everything."""
+    import play
+    from play.physics import physics_space, _pending_static_bodies
+
+    calls = []
+    monkeypatch.setattr(physics_space, "reindex_static", lambda: calls.append(1))
+
+    box = play.new_box(width=10, height=10)
+    box.start_physics(can_move=False)
+
+    box.x = 50
+    box.y = 20
+
+    assert not calls
+    assert box.physics._pymunk_body in _pending_static_bodies
+
+
+def test_flush_reindexes_each_body_once(monkeypatch):
+    """flush_static_reindex reindexes every moved body once and clears the queue."""
+    import play
+    from play.physics import (
+        physics_space,
+        flush_static_reindex,
+        _pending_static_bodies,
+    )
+
+    boxes = [play.new_box(width=10, height=10) for _ in range(3)]
+    for box in boxes:
+        box.start_physics(can_move=False)
+
+    reindexed = []
+    original = physics_space.reindex_shapes_for_body
+    monkeypatch.setattr(
+        physics_space,
+        "reindex_shapes_for_body",
+        lambda body: reindexed.append(body) or original(body),
+    )
+
+    for i, box in enumerate(boxes):
+        box.x = i * 30
+        box.y = i * 30
+        box.x += 1
+
+    flush_static_reindex()
+
+    assert sorted(map(id, reindexed)) == sorted(
+        id(box.physics._pymunk_body) for box in boxes
+    )
+    assert not _pending_static_bodies
+
+
+def test_flush_skips_removed_sprites():
+    """A static sprite removed before the flush must not be reindexed."""
+    import play
+    from play.physics import flush_static_reindex, _pending_static_bodies
+
+    box = play.new_box(width=10, height=10)
+    box.start_physics(can_move=False)
+    box.x = 100
+    box.remove()
+
+    flush_static_reindex()
+
+    assert not _pending_static_bodies
+
+
+def test_is_touching_sees_moved_static_sprite():
+    """Queries flush pending moves so they see the static sprite's new position."""
+    import play
+
+    paddle = play.new_box(x=0, y=0, width=10, height=40)
+    paddle.start_physics(can_move=False)
+    ball = play.new_circle(x=100, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False)
+
+    assert not ball.is_touching(paddle)
+
+    paddle.x = 100
+
+    assert ball.is_touching(paddle)
+
+
+def test_moved_static_sprite_collides_in_game_loop():
+    """A static sprite moved into a ball's path is hit on the next step."""
+    import play
+
+    hits = [0]
+    frames = [0]
+
+    ball = play.new_circle(x=0, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=200)
+    wall = play.new_box(x=-300, y=0, width=10, height=100)
+    wall.start_physics(can_move=False)
+
+    @ball.when_touching(wall)
+    def on_hit():
+        hits[0] += 1
+
+    @play.when_program_starts
+    def move_wall():
+        wall.x = 60
+
+    @play.repeat_forever
+    def stop():
+        frames[0] += 1
+        if hits[0] or frames[0] > 60:
+            play.stop_program()
+
+    play.start_program()
+
+    assert hits[0] > 0, "ball should hit the static wall at its new position"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,103 @@
+"""Tests that is_touching reads the contacts pymunk found during the last step."""
+
+import pytest
+import pymunk
+
+
+def _count_calls(monkeypatch, cls, name):
+    calls = []
+    original = getattr(cls, name)
+
+    def counting(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, name, counting)
+    return calls
+
+
+def test_is_touching_uses_last_step_contacts(monkeypatch):
+    """After a step, repeated is_touching calls are set lookups."""
+    import play
+    from play.physics import step_physics
+
+    paddle = play.new_box(x=0, y=0, width=10, height=40)
+    paddle.start_physics(can_move=False)
+    ball = play.new_circle(x=12, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False)
+    far = play.new_circle(x=200, y=0, radius=10)
+    far.start_physics(obeys_gravity=False)
+
+    step_physics(1 / 60)
+
+    collide_calls = _count_calls(monkeypatch, pymunk.Shape, "shapes_collide")
+    arbiter_calls = _count_calls(monkeypatch, pymunk.Body, "each_arbiter")
+
+    for _ in range(10):
+        assert ball.is_touching(paddle)
+        assert not ball.is_touching(far)
+
+    assert not collide_calls
+    assert len(arbiter_calls) == 1
+
+
+def test_cache_is_rebuilt_after_each_step(monkeypatch):
+    """Contacts are read again once the simulation has stepped."""
+    import play
+    from play.physics import step_physics
+
+    paddle = play.new_box(x=0, y=0, width=10, height=40)
+    paddle.start_physics(can_move=False)
+    ball = play.new_circle(x=12, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False)
+
+    step_physics(1 / 60)
+    assert ball.is_touching(paddle)
+
+    ball.physics.x_speed = 300
+    arbiter_calls = _count_calls(monkeypatch, pymunk.Body, "each_arbiter")
+    for _ in range(20):
+        step_physics(1 / 60)
+
+    assert not ball.is_touching(paddle)
+    assert len(arbiter_calls) == 1
+
+
+def test_moved_static_sprite_falls_back_to_direct_check():
+    """Moving a static sprite after the step makes the stored contacts stale."""
+    import play
+    from play.physics import step_physics
+
+    paddle = play.new_box(x=0, y=0, width=10, height=40)
+    paddle.start_physics(can_move=False)
+    ball = play.new_circle(x=12, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False)
+
+    step_physics(1 / 60)
+    assert ball.is_touching(paddle)
+
+    paddle.x = -200
+
+    assert not ball.is_touching(paddle)
+
+
+def test_sensor_and_filtered_pairs_still_detected():
+    """Pairs that never get arbiters use the direct check."""
+    import play
+    from play.physics import step_physics
+
+    ball = play.new_circle(x=0, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False)
+    zone = play.new_box(x=5, y=0, width=20, height=20)
+    zone.start_physics(can_move=False, sensor=True)
+    ghost = play.new_circle(x=-5, y=0, radius=10)
+    ghost.start_physics(obeys_gravity=False, layer="ghosts", collides_with=[])
+
+    step_physics(1 / 60)
+
+    assert ball.is_touching(zone)
+    assert ball.is_touching(ghost)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
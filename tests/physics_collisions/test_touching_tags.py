@@ -0,0 +1,135 @@
+"""Tests for when_touching() and when_stopped_touching() with tag names."""
+
+import pytest
+
+
+def _run_frames(play, frames):
+    count = [0]
+
+    @play.repeat_forever
+    def stop_later():
+        count[0] += 1
+        if count[0] >= frames:
+            play.stop_program()
+
+    play.start_program()
+
+
+def test_one_handler_covers_every_tagged_sprite():
+    """The callback gets each tagged sprite it touches, untagged ones are ignored."""
+    import play
+    from play.callback.collision_callbacks import collision_registry
+
+    player = play.new_circle(x=0, y=0, radius=10)
+    player.start_physics(obeys_gravity=False, x_speed=300)
+    coins = [play.new_box(x=x, y=0, width=10, height=10) for x in (60, 120)]
+    for coin in coins:
+        coin.start_physics(can_move=False, sensor=True)
+        coin.add_tag("coin")
+    rock = play.new_box(x=180, y=0, width=10, height=10)
+    rock.start_physics(can_move=False)
+
+    collected = []
+
+    @player.when_touching("coin")
+    def collect(coin):
+        collected.append(coin)
+        coin.remove()
+
+    _run_frames(play, 60)
+
+    assert collected == coins
+    shape_ct = player.physics._pymunk_shape.collision_type
+    assert collision_registry.handled_pairs == {frozenset((shape_ct, None))}
+
+
+def test_tagging_needs_no_registration():
+    """Tagged sprites don't track who reacts to them."""
+    import play
+    from play.callback.collision_callbacks import collision_registry
+
+    player = play.new_circle(x=0, y=0, radius=10)
+
+    @player.when_touching("enemy")
+    def hit():
+        pass
+
+    enemies = [play.new_box(x=50 * i, y=100) for i in range(5)]
+    for enemy in enemies:
+        enemy.add_tag("enemy")
+        assert enemy.has_tag("enemy")
+        assert not enemy.events._dependent_sprites
+
+    assert len(collision_registry.shape_registry) == 1
+    enemies[0].remove_tag("enemy")
+    assert enemies[0].tags == frozenset()
+
+
+def test_untagged_sprite_stops_calling_back():
+    """Removing a tag while touching stops the callback right away."""
+    import play
+
+    player = play.new_circle(x=0, y=0, radius=10)
+    player.start_physics(obeys_gravity=False)
+    lava = play.new_box(x=0, y=0, width=50, height=50)
+    lava.start_physics(can_move=False)
+    lava.add_tag("lava")
+
+    calls = [0]
+
+    @player.when_touching("lava")
+    def burn():
+        calls[0] += 1
+        if calls[0] == 3:
+            lava.remove_tag("lava")
+
+    _run_frames(play, 20)
+
+    assert calls[0] == 3
+
+
+def test_when_stopped_touching_tag():
+    """The stopped callback gets the tagged sprite that was left."""
+    import play
+
+    player = play.new_circle(x=0, y=0, radius=10)
+    player.start_physics(obeys_gravity=False, x_speed=200)
+    zone = play.new_box(x=30, y=0, width=40, height=40)
+    zone.start_physics(can_move=False, sensor=True)
+    zone.add_tag("zone")
+
+    left = []
+
+    @player.when_stopped_touching("zone")
+    def leave(sprite):
+        left.append(sprite)
+
+    _run_frames(play, 60)
+
+    assert left == [zone]
+
+
+def test_tag_callbacks_survive_start_physics():
+    """Restarting physics keeps tag callbacks working."""
+    import play
+
+    player = play.new_circle(x=0, y=0, radius=10)
+    touched = []
+
+    @player.when_touching("coin")
+    def collect(coin):
+        touched.append(coin)
+        coin.remove()
+
+    player.start_physics(obeys_gravity=False, x_speed=300)
+    coin = play.new_box(x=60, y=0, width=10, height=10)
+    coin.start_physics(can_move=False)
+    coin.add_tag("coin")
+
+    _run_frames(play, 30)
+
+    assert touched == [coin]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
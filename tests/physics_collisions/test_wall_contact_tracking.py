@@ -0,0 +1,113 @@
+"""Tests that wall contacts are tracked from collision events."""
+
+import pytest
+import pymunk
+
+
+def test_touching_walls_tracked_from_contacts(monkeypatch):
+    """After a step, wall queries read tracked contacts without shapes_collide."""
+    import play
+    from play.callback.collision_callbacks import WallSide
+
+    ball = play.new_circle(x=300, y=0, radius=20)
+    ball.start_physics(obeys_gravity=False, x_speed=0)
+    ball.x = 385
+
+    collide_calls = []
+    original = pymunk.Shape.shapes_collide
+
+    def counting_collide(self, other):
+        collide_calls.append(other)
+        return original(self, other)
+
+    result = []
+    frames = [0]
+
+    @play.repeat_forever
+    def check():
+        frames[0] += 1
+        if frames[0] == 3:
+            monkeypatch.setattr(pymunk.Shape, "shapes_collide", counting_collide)
+            result.append(ball.get_touching_walls())
+            result.append(ball.is_touching_wall())
+            play.stop_program()
+
+    play.start_program()
+
+    assert result == [[WallSide.RIGHT], True]
+    assert not collide_calls
+    assert ball.events.touching_walls == {WallSide.RIGHT}
+
+
+def test_separation_clears_tracked_wall():
+    """Moving away from a wall removes it from the tracked set."""
+    import play
+
+    ball = play.new_circle(x=385, y=0, radius=20)
+    ball.start_physics(obeys_gravity=False, x_speed=-200)
+
+    result = []
+    frames = [0]
+
+    @play.repeat_forever
+    def check():
+        frames[0] += 1
+        if frames[0] == 30:
+            result.append(ball.is_touching_wall())
+            result.append(set(ball.events.touching_walls))
+            play.stop_program()
+
+    play.start_program()
+
+    assert result == [False, set()]
+
+
+def test_hiding_sprite_clears_tracked_walls():
+    """Removing a shape from the space fires separate for its wall contacts."""
+    import play
+
+    ball = play.new_circle(x=385, y=0, radius=20)
+    ball.start_physics(obeys_gravity=False)
+
+    result = []
+    frames = [0]
+
+    @play.repeat_forever
+    def check():
+        frames[0] += 1
+        if frames[0] == 3:
+            result.append(set(ball.events.touching_walls))
+            ball.hide()
+            result.append(set(ball.events.touching_walls))
+            play.stop_program()
+
+    play.start_program()
+
+    assert result[0]
+    assert result[1] == set()
+
+
+def test_static_sprite_still_detects_walls():
+    """Static sprites never get wall contacts, so they use the direct check."""
+    import play
+
+    box = play.new_box(x=380, y=0, width=50, height=50)
+    box.start_physics(can_move=False)
+
+    result = []
+    frames = [0]
+
+    @play.repeat_forever
+    def check():
+        frames[0] += 1
+        if frames[0] == 3:
+            result.append(box.is_touching_wall())
+            play.stop_program()
+
+    play.start_program()
+
+    assert result == [True]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
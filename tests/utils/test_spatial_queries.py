@@ -0,0 +1,122 @@
+"""Tests for the spatial query functions."""
+
+import pytest
+
+
+def test_sprites_at_returns_sprites_containing_point():
+    import play
+
+    box = play.new_box(x=0, y=0, width=40, height=40)
+    circle = play.new_circle(x=10, y=0, radius=15)
+    far = play.new_box(x=300, y=200, width=10, height=10)
+
+    found = play.sprites_at((5, 0))
+
+    assert box in found
+    assert circle in found
+    assert far not in found
+
+
+def test_sprites_at_ignores_walls_and_empty_space():
+    import play
+
+    play.new_box(x=0, y=0, width=10, height=10)
+
+    assert play.sprites_at((200, 200)) == []
+    # (screen.left, 0) lies on the left wall, which is not a sprite
+    assert play.sprites_at((play.screen.left, 0)) == []
+
+
+def test_sprites_at_skips_hidden_sprites():
+    import play
+
+    box = play.new_box(x=0, y=0, width=40, height=40)
+    box.hide()
+
+    assert play.sprites_at((0, 0)) == []
+
+    box.show()
+
+    assert play.sprites_at((0, 0)) == [box]
+
+
+def test_sprites_in_box_accepts_any_corner_order():
+    import play
+
+    inside = play.new_box(x=50, y=50, width=10, height=10)
+    outside = play.new_box(x=-200, y=-200, width=10, height=10)
+
+    assert play.sprites_in_box((0, 0, 100, 100)) == [inside]
+    assert play.sprites_in_box((100, 100, 0, 0)) == [inside]
+    assert outside not in play.sprites_in_box((0, 0, 100, 100))
+
+
+def test_sprites_in_radius_sorted_by_distance():
+    import play
+
+    near = play.new_circle(x=20, y=0, radius=5)
+    nearer = play.new_circle(x=10, y=0, radius=5)
+    far = play.new_circle(x=200, y=0, radius=5)
+
+    found = play.sprites_in_radius(0, 0, 50)
+
+    assert found == [nearer, near]
+    assert far not in found
+
+
+def test_raycast_returns_sprites_in_hit_order():
+    import play
+
+    first = play.new_box(x=-100, y=0, width=10, height=10)
+    second = play.new_box(x=100, y=0, width=10, height=10)
+    off_line = play.new_box(x=0, y=100, width=10, height=10)
+
+    assert play.raycast((-300, 0), (300, 0)) == [first, second]
+    assert play.raycast((300, 0), (-300, 0)) == [second, first]
+    assert off_line not in play.raycast((-300, 0), (300, 0))
+
+
+def test_queries_see_moved_static_sprite():
+    import play
+
+    box = play.new_box(x=0, y=0, width=10, height=10)
+    box.start_physics(can_move=False)
+
+    box.x = 150
+
+    assert play.sprites_at((150, 0)) == [box]
+    assert play.sprites_at((0, 0)) == []
+
+
+def test_removed_sprite_is_not_returned():
+    import play
+    from play.physics import shape_sprites
+
+    box = play.new_box(x=0, y=0, width=10, height=10)
+    shape = box.physics._pymunk_shape
+    box.remove()
+
+    assert play.sprites_at((0, 0)) == []
+    assert shape not in shape_sprites
+
+
+def test_queries_follow_dynamic_sprites_in_game_loop():
+    import play
+
+    result = []
+    ball = play.new_circle(x=0, y=0, radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=300)
+
+    @play.repeat_forever
+    def check():
+        if ball.x > 100:
+            result.extend(play.sprites_at((ball.x, ball.y)))
+            play.stop_program()
+
+    play.start_program()
+
+    assert result == [ball]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])